@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Headless benchmark of the construction, state-update and repaint throughput
+of all controls and stylesheets of `dvg_pyqt_controls`.
+
+Runs offscreen (`QT_QPA_PLATFORM=offscreen`) and reports, per factory and per
+`SS_*` stylesheet:
+  - created_per_s      : Widgets created, laid out and polished per second
+  - flips_per_s        : Checked-state flips per second, including repaint
+  - repaint_ms         : Time of a full synchronous repaint of all widgets
+  - memory_per_widget_kB: Growth of the resident memory per widget, or None
+                         when it can not be determined on this platform
+
+Results are written as JSON to compare across versions and Qt libs.
+
+Usage:
+    python benchmark_controls.py [--N 200] [--lib PyQt5 | --all] [--output FILE]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import importlib.util
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+QT_LIB_ORDER = ["PyQt5", "PySide2", "PySide6", "PyQt6"]
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+N_FLIP_ROUNDS = 10
+N_REPAINTS = 10
+
+FACTORIES = [
+    "create_LED_indicator",
+    "create_LED_indicator_rect",
+    "create_error_LED",
+    "create_tiny_LED",
+    "create_tiny_error_LED",
+    "create_Relay_button",
+    "create_Toggle_button",
+    "create_Toggle_button_2",
+    "create_Toggle_button_3",
+]
+
+PAINTED_FACTORIES = FACTORIES[:5]
+
+# Widget class to show each stylesheet on, by role
+SHEET_WIDGETS = {
+    "hover": "QLineEdit",
+    "textbox_read_only": "QLineEdit",
+    "textbox_errors": "QLineEdit",
+    "tabs": "QTabWidget",
+    "group": "QGroupBox",
+    "group_rect": "QGroupBox",
+    "title": "QLabel",
+}
+
+
+def rss_bytes():
+    """Return the resident memory of this process, or None when unknown."""
+    try:
+        import psutil  # pylint: disable=import-outside-toplevel
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def bench_case(c, name: str, make_widget, N: int) -> dict:
+    """Benchmark `N` widgets created by the function `make_widget(k)`."""
+    app = c.QtWid.QApplication.instance()
+
+    container = c.QtWid.QWidget()
+    grid = c.QtWid.QGridLayout(container)
+    container.show()
+    app.processEvents()
+
+    rss_0 = rss_bytes()
+    t_0 = time.perf_counter()
+    widgets = []
+    for k in range(N):
+        widget = make_widget(k)
+        grid.addWidget(widget, k // 20, k % 20)
+        widgets.append(widget)
+    for widget in widgets:
+        widget.ensurePolished()
+    app.processEvents()
+    t_create = time.perf_counter() - t_0
+    rss_1 = rss_bytes()
+
+    flips_per_s = None
+    if all(getattr(w, "isCheckable", lambda: False)() for w in widgets):
+        t_0 = time.perf_counter()
+        for _ in range(N_FLIP_ROUNDS):
+            for widget in widgets:
+                widget.setChecked(not widget.isChecked())
+            container.repaint()
+        flips_per_s = N * N_FLIP_ROUNDS / (time.perf_counter() - t_0)
+
+    t_0 = time.perf_counter()
+    for _ in range(N_REPAINTS):
+        container.repaint()
+    t_repaint = (time.perf_counter() - t_0) / N_REPAINTS
+
+    container.close()
+    container.deleteLater()
+    app.processEvents()
+
+    return {
+        "name": name,
+        "N": N,
+        "created_per_s": N / t_create,
+        "flips_per_s": flips_per_s,
+        "repaint_ms": t_repaint * 1e3,
+        "memory_per_widget_kB": (
+            None
+            if rss_0 is None or rss_1 is None
+            else (rss_1 - rss_0) / N / 1024
+        ),
+    }
+
+
+def run(N: int) -> dict:
+    sys.path.insert(0, SRC_DIR)
+    import dvg_pyqt_controls as c  # pylint: disable=import-outside-toplevel
+
+    app = c.QtWid.QApplication.instance() or c.QtWid.QApplication(sys.argv)
+    qt_version = (
+        c.QtCore.QT_VERSION_STR
+        if c.QT_LIB in (c.PYQT5, c.PYQT6)
+        else c.QtCore.__version__
+    )
+
+    results = []
+    for factory_name in FACTORIES:
+        factory = getattr(c, factory_name)
+        results.append(
+            bench_case(
+                c,
+                factory_name,
+                lambda k, factory=factory: factory(
+                    text="0", checked=bool(k % 2)
+                ),
+                N,
+            )
+        )
+
+    for factory_name in PAINTED_FACTORIES:
+        factory = getattr(c, factory_name)
+        results.append(
+            bench_case(
+                c,
+                factory_name + "(painted=True)",
+                lambda k, factory=factory: factory(
+                    painted=True, text="0", checked=bool(k % 2)
+                ),
+                N,
+            )
+        )
+
+    for role in c.SS_TEMPLATES:
+        sheet = c.current_theme().stylesheet(role)
+        widget_class = getattr(c.QtWid, SHEET_WIDGETS.get(role, "QPushButton"))
+
+        def make_widget(k, widget_class=widget_class, sheet=sheet):
+            widget = widget_class()
+            if widget_class is c.QtWid.QPushButton:
+                widget.setCheckable(True)
+                widget.setChecked(bool(k % 2))
+            widget.setStyleSheet(sheet)
+            return widget
+
+        results.append(bench_case(c, "SS_" + role.upper(), make_widget, N))
+
+    app.processEvents()
+    return {
+        "qt_lib": c.QT_LIB,
+        "qt_version": qt_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "module_version": c.__version__,
+        "results": results,
+    }
+
+
+# ------------------------------------------------------------------------------
+#   Main
+# ------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--N", type=int, default=200, help="widgets per case")
+    parser.add_argument("--lib", choices=QT_LIB_ORDER, help="Qt lib to use")
+    parser.add_argument(
+        "--all", action="store_true", help="run for every installed Qt lib"
+    )
+    parser.add_argument("--output", help="JSON file to write the results to")
+    args = parser.parse_args()
+
+    if args.all:
+        # Each Qt lib needs a fresh interpreter
+        report = []
+        for lib in QT_LIB_ORDER:
+            if importlib.util.find_spec(lib) is None:
+                continue
+            output = subprocess.run(
+                [sys.executable, __file__, "--N", str(args.N), "--lib", lib],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            report.append(json.loads(output))
+    else:
+        if args.lib:
+            os.environ["DVG_QT_LIB"] = args.lib
+        report = run(args.N)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark of the cold-start import time of `dvg_pyqt_controls` for each
+installed Qt lib.
+
+Every measurement runs in a fresh Python interpreter, where the Qt lib is
+enforced through the environment variable `DVG_QT_LIB`. Reported are the median
+times of importing the Qt lib on its own and of importing `dvg_pyqt_controls`
+on top of that.
+
+Usage:
+    python benchmark_import.py [N_repeats] [--json]
+"""
+
+import os
+import sys
+import json
+import subprocess
+import importlib.util
+from statistics import median
+
+QT_LIB_ORDER = ["PyQt5", "PySide2", "PySide6", "PyQt6"]
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Code executed in each fresh interpreter. Prints the two durations in seconds.
+PROBE = """
+import time
+t0 = time.perf_counter()
+from {lib} import QtCore, QtGui, QtWidgets
+t1 = time.perf_counter()
+import dvg_pyqt_controls
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def measure(lib: str, N_repeats: int) -> dict:
+    env = dict(os.environ, DVG_QT_LIB=lib)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])
+    )
+
+    t_qt = []
+    t_module = []
+    for _ in range(N_repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(lib=lib)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        t_qt.append(float(output[0]))
+        t_module.append(float(output[1]))
+
+    return {
+        "qt_lib": lib,
+        "N_repeats": N_repeats,
+        "import_qt_ms": median(t_qt) * 1e3,
+        "import_module_ms": median(t_module) * 1e3,
+    }
+
+
+# ------------------------------------------------------------------------------
+#   Main
+# ------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    N_repeats = 10
+    as_json = "--json" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--json"]
+    if args:
+        N_repeats = int(args[0])
+
+    results = [
+        measure(lib, N_repeats)
+        for lib in QT_LIB_ORDER
+        if importlib.util.find_spec(lib) is not None
+    ]
+
+    if as_json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'Qt lib':9s} {'Qt import':>12s} {'module import':>15s}")
+        for result in results:
+            print(
+                f"{result['qt_lib']:9s} "
+                f"{result['import_qt_ms']:9.1f} ms "
+                f"{result['import_module_ms']:12.1f} ms"
+            )
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Offscreen visual-regression and render-time check of all controls and
+stylesheets of `dvg_pyqt_controls`.
+
+Every factory, including its painted variant, and every `SS_*` stylesheet is
+rendered in each combination of enabled/disabled, checked/unchecked (read-only
+for textboxes) and hovered/not hovered. The images are pixel-diffed against
+stored baselines, and the fastest time of grabbing each control is compared to
+the baseline timings. Any visual change or render slowdown is reported and
+makes the script exit with a non-zero status.
+
+Create or refresh the baselines with `--update`, e.g. before upgrading the Qt
+lib, and run without it afterwards. Baselines made with one Qt lib can be
+checked against another one with `--lib`. Requires NumPy.
+
+Usage:
+    python render_regression.py [--update] [--lib PyQt5] [--baseline DIR]
+                                [--time-tolerance 1.0] [--output FILE]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+QT_LIB_ORDER = ["PyQt5", "PySide2", "PySide6", "PyQt6"]
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+BASELINE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "render_baselines"
+)
+
+# The fastest of this many grabs is taken as the render time of a control
+N_GRABS = 50
+
+# Increases of the render time below this are considered noise [ms]
+MIN_TIME_DIFF = 0.1
+
+FACTORIES = [
+    "create_LED_indicator",
+    "create_LED_indicator_rect",
+    "create_error_LED",
+    "create_tiny_LED",
+    "create_tiny_error_LED",
+    "create_Relay_button",
+    "create_Toggle_button",
+    "create_Toggle_button_2",
+    "create_Toggle_button_3",
+]
+
+PAINTED_FACTORIES = FACTORIES[:5]
+
+# Stylesheets that are not covered by the factories
+SHEET_ROLES = [
+    "hover",
+    "textbox_read_only",
+    "textbox_errors",
+    "tabs",
+    "group",
+    "group_rect",
+    "title",
+]
+TEXTBOX_ROLES = SHEET_ROLES[:3]
+
+# (enabled, checked, hover)
+STATES = [
+    (enabled, checked, hover)
+    for enabled in (True, False)
+    for checked in (False, True)
+    for hover in (False, True)
+]
+
+
+def make_sheet_widget(c, role: str, checked: bool):
+    """Return a representative widget styled by the stylesheet of `role`. For
+    textboxes `checked` selects the read-only variant.
+    """
+    sheet = c.current_theme().stylesheet(role)
+    if role in TEXTBOX_ROLES:
+        widget = c.QtWid.QLineEdit("12.345")
+        widget.setReadOnly(checked)
+    elif role == "tabs":
+        widget = c.QtWid.QTabWidget()
+        widget.addTab(c.QtWid.QLabel("Tab 1"), "Tab 1")
+        widget.addTab(c.QtWid.QLabel("Tab 2"), "Tab 2")
+    elif role in ("group", "group_rect"):
+        widget = c.QtWid.QGroupBox("Group")
+        grid = c.QtWid.QGridLayout(widget)
+        grid.addWidget(c.QtWid.QLabel("Label"), 0, 0)
+        grid.addWidget(c.QtWid.QPushButton("Button"), 0, 1)
+    else:
+        widget = c.QtWid.QLabel("Title")
+    widget.setStyleSheet(sheet)
+    return widget
+
+
+def cases(c):
+    """Yield the name and a function creating the widget of every control and
+    state to render.
+    """
+    for factory_name in FACTORIES:
+        factory = getattr(c, factory_name)
+        painted_variants = (
+            (False, True) if factory_name in PAINTED_FACTORIES else (False,)
+        )
+        for painted in painted_variants:
+            for enabled, checked, hover in STATES:
+                name = factory_name + (".painted" if painted else "")
+
+                def make_widget(
+                    factory=factory, painted=painted, checked=checked
+                ):
+                    if painted:
+                        return factory(painted=True, text="1", checked=checked)
+                    return factory(text="1", checked=checked)
+
+                yield state_name(name, enabled, checked, hover), (
+                    make_widget,
+                    enabled,
+                    hover,
+                )
+
+    for role in SHEET_ROLES:
+        for enabled, checked, hover in STATES:
+            if checked and role not in TEXTBOX_ROLES:
+                continue
+            yield state_name("SS_" + role.upper(), enabled, checked, hover), (
+                lambda role=role, checked=checked: make_sheet_widget(
+                    c, role, checked
+                ),
+                enabled,
+                hover,
+            )
+
+
+def state_name(name: str, enabled: bool, checked: bool, hover: bool) -> str:
+    return ".".join(
+        [
+            name,
+            "enabled" if enabled else "disabled",
+            "checked" if checked else "unchecked",
+            "hover" if hover else "normal",
+        ]
+    )
+
+
+def render(c, QtTest, make_widget, enabled: bool, hover: bool) -> tuple:
+    """Render a widget offscreen.
+
+    Returns:
+        (QImage, fastest grab time in ms)
+    """
+    app = c.QtWid.QApplication.instance()
+    widget = make_widget()
+    widget.setEnabled(enabled)
+    widget.resize(widget.sizeHint())
+    widget.show()
+    app.processEvents()
+
+    # Hover near the top-left corner, which also hits the title of groupboxes
+    # and the first tab of tab widgets
+    if hover:
+        pos = c.QtCore.QPoint(
+            min(8, widget.width() // 2), min(8, widget.height() // 2)
+        )
+        QtTest.QTest.mouseMove(widget, pos)
+        app.processEvents()
+
+    image = widget.grab().toImage()
+    durations = []
+    for _ in range(N_GRABS):
+        t_0 = time.perf_counter()
+        widget.grab()
+        durations.append(time.perf_counter() - t_0)
+
+    if hover:
+        QtTest.QTest.mouseMove(widget, c.QtCore.QPoint(-100, -100))
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+    return image, min(durations) * 1e3
+
+
+def pixel_diff(c, image, baseline) -> tuple:
+    """Compare two images.
+
+    Returns:
+        (number of differing pixels, diff image or None when equal)
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if image.size() != baseline.size():
+        return image.width() * image.height(), None
+
+    def as_array(img):
+        img = img.convertToFormat(c.QtGui.QImage.Format.Format_ARGB32)
+        width, height = img.width(), img.height()
+        buffer = img.constBits()
+        if hasattr(buffer, "setsize"):
+            buffer.setsize(img.sizeInBytes())
+        return (
+            np.frombuffer(buffer, dtype=np.uint8)
+            .reshape(height, img.bytesPerLine())[:, : 4 * width]
+            .reshape(height, width, 4)
+            .copy()
+        )
+
+    a = as_array(image)
+    b = as_array(baseline)
+    changed = np.any(a != b, axis=2)
+    N_changed = int(changed.sum())
+    if not N_changed:
+        return 0, None
+
+    # Changed pixels in magenta on top of a faded copy of the new image
+    diff = a // 4 + 160
+    diff[..., 3] = 255
+    diff[changed] = (255, 0, 255, 255)
+    diff = np.ascontiguousarray(diff)
+    diff_image = c.QtGui.QImage(
+        diff.tobytes(),
+        diff.shape[1],
+        diff.shape[0],
+        4 * diff.shape[1],
+        c.QtGui.QImage.Format.Format_ARGB32,
+    ).copy()
+    return N_changed, diff_image
+
+
+def run(args) -> dict:
+    sys.path.insert(0, SRC_DIR)
+    import dvg_pyqt_controls as c  # pylint: disable=import-outside-toplevel
+
+    QtTest = importlib.import_module(c.QT_LIB + ".QtTest")
+    app = c.QtWid.QApplication.instance() or c.QtWid.QApplication(sys.argv)
+
+    # Fix the style and font, so that only this module decides the looks
+    app.setStyle("Fusion")
+    c.QtGui.QGuiApplication.setFont(
+        c.QtGui.QFont(c.QtGui.QGuiApplication.font().family(), 9)
+    )
+
+    timings_file = os.path.join(args.baseline, "timings.json")
+    baseline_timings = {}
+    if not args.update:
+        if not os.path.isfile(timings_file):
+            sys.exit(
+                f"No baselines found in '{args.baseline}'. "
+                "Create them first with --update."
+            )
+        with open(timings_file, encoding="utf-8") as f:
+            baseline_timings = json.load(f)["timings_ms"]
+    os.makedirs(args.baseline, exist_ok=True)
+
+    results = []
+    timings = {}
+    for name, (make_widget, enabled, hover) in cases(c):
+        image, t_grab = render(c, QtTest, make_widget, enabled, hover)
+        timings[name] = t_grab
+        image_file = os.path.join(args.baseline, name + ".png")
+
+        if args.update:
+            image.save(image_file)
+            continue
+
+        result = {"name": name, "grab_ms": t_grab, "failures": []}
+        baseline = c.QtGui.QImage(image_file)
+        if baseline.isNull():
+            result["failures"].append("missing baseline image")
+        else:
+            N_changed, diff_image = pixel_diff(c, image, baseline)
+            if N_changed:
+                result["failures"].append(f"{N_changed} pixels differ")
+                result["pixels_changed"] = N_changed
+                if args.diff_dir:
+                    os.makedirs(args.diff_dir, exist_ok=True)
+                    image.save(os.path.join(args.diff_dir, name + ".png"))
+                    if diff_image is not None:
+                        diff_image.save(
+                            os.path.join(args.diff_dir, name + ".diff.png")
+                        )
+
+        t_baseline = baseline_timings.get(name)
+        if t_baseline is not None:
+            result["baseline_grab_ms"] = t_baseline
+            if (
+                t_grab > t_baseline * (1 + args.time_tolerance)
+                and t_grab - t_baseline > MIN_TIME_DIFF
+            ):
+                result["failures"].append(
+                    f"render time {t_grab:.3f} ms > baseline "
+                    f"{t_baseline:.3f} ms"
+                )
+        results.append(result)
+
+    qt_version = (
+        c.QtCore.QT_VERSION_STR
+        if c.QT_LIB in (c.PYQT5, c.PYQT6)
+        else c.QtCore.__version__
+    )
+    if args.update:
+        with open(timings_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "qt_lib": c.QT_LIB,
+                    "qt_version": qt_version,
+                    "timings_ms": timings,
+                },
+                f,
+                indent=2,
+            )
+
+    return {
+        "qt_lib": c.QT_LIB,
+        "qt_version": qt_version,
+        "N_cases": len(timings),
+        "N_failed": sum(bool(result["failures"]) for result in results),
+        "results": results,
+    }
+
+
+# ------------------------------------------------------------------------------
+#   Main
+# ------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--update", action="store_true", help="(re)create the baselines"
+    )
+    parser.add_argument("--lib", choices=QT_LIB_ORDER, help="Qt lib to use")
+    parser.add_argument(
+        "--baseline", default=BASELINE_DIR, help="directory of the baselines"
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=1.0,
+        help="allowed relative increase of the render time",
+    )
+    parser.add_argument(
+        "--diff-dir", help="directory to save the images that changed to"
+    )
+    parser.add_argument("--output", help="JSON file to write the results to")
+    args = parser.parse_args()
+
+    if args.lib:
+        os.environ["DVG_QT_LIB"] = args.lib
+    report = run(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update:
+        print(f"Stored {report['N_cases']} baselines in '{args.baseline}'.")
+        sys.exit(0)
+
+    for result in report["results"]:
+        if result["failures"]:
+            print(f"FAIL {result['name']}: {'; '.join(result['failures'])}")
+    print(
+        f"{report['qt_lib']} {report['qt_version']}: "
+        f"{report['N_failed']} of {report['N_cases']} cases failed."
+    )
+    sys.exit(1 if report["N_failed"] else 0)
@@ -51,7 +51,6 @@ setup(
         "Intended Audience :: Science/Research",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -71,7 +70,7 @@ setup(
         "controls",
         "stylesheets",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=[],
     extras_require={},
 )
@@ -11,6 +11,17 @@ __version__ = "1.4.0"
 
 import os
 import sys
+import re
+import math
+import time
+import threading
+import weakref
+import importlib.util
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, List, Optional, Sequence, Union
 
 # Mechanism to support both PyQt and PySide
 # -----------------------------------------
@@ -22,40 +33,69 @@ PYSIDE6 = "PySide6"
 QT_LIB_ORDER = [PYQT5, PYSIDE2, PYSIDE6, PYQT6]
 QT_LIB = None
 
-if QT_LIB is None:
+# Optionally enforce a Qt lib through an environment variable, e.g.
+# `DVG_QT_LIB=PySide6`. Alternatively, import the Qt lib of your choice before
+# importing this module.
+if os.environ.get("DVG_QT_LIB"):
+    env_lib = os.environ["DVG_QT_LIB"].upper()
     for lib in QT_LIB_ORDER:
-        if lib in sys.modules:
+        if env_lib == lib.upper():
             QT_LIB = lib
             break
+    else:
+        raise ImportError(
+            f"Environment variable DVG_QT_LIB='{os.environ['DVG_QT_LIB']}' "
+            f"must be one of {QT_LIB_ORDER}."
+        )
 
 if QT_LIB is None:
     for lib in QT_LIB_ORDER:
-        try:
-            __import__(lib)
+        if lib in sys.modules:
             QT_LIB = lib
             break
-        except ImportError:
-            pass
+
+if QT_LIB is None:
+    # Look up the installed packages without trial-importing them all
+    qt_libs = [
+        lib for lib in QT_LIB_ORDER if importlib.util.find_spec(lib) is not None
+    ]
+else:
+    qt_libs = [QT_LIB]
+
+# Fall back on the next installed Qt lib when one fails to import
+QT_LIB = None
+for lib in qt_libs:
+    # fmt: off
+    # pylint: disable=import-error, no-name-in-module
+    try:
+        if lib == PYQT5:
+            from PyQt5 import QtCore, QtGui, QtWidgets as QtWid   # type: ignore
+        elif lib == PYQT6:
+            from PyQt6 import QtCore, QtGui, QtWidgets as QtWid   # type: ignore
+        elif lib == PYSIDE2:
+            from PySide2 import QtCore, QtGui, QtWidgets as QtWid # type: ignore
+        elif lib == PYSIDE6:
+            from PySide6 import QtCore, QtGui, QtWidgets as QtWid # type: ignore
+    except ImportError:
+        continue
+    # pylint: enable=import-error, no-name-in-module
+    # fmt: on
+    QT_LIB = lib
+    break
 
 if QT_LIB is None:
     this_file = __file__.split(os.sep)[-1]
     raise ImportError(
         f"{this_file} requires PyQt5, PyQt6, PySide2 or PySide6; "
-        "none of these packages could be imported."
+        f"none of these packages could be imported (tried {qt_libs})."
     )
 
-# fmt: off
-# pylint: disable=import-error, no-name-in-module
-if QT_LIB == PYQT5:
-    from PyQt5 import QtCore, QtGui, QtWidgets as QtWid    # type: ignore
-elif QT_LIB == PYQT6:
-    from PyQt6 import QtCore, QtGui, QtWidgets as QtWid    # type: ignore
-elif QT_LIB == PYSIDE2:
-    from PySide2 import QtCore, QtGui, QtWidgets as QtWid  # type: ignore
-elif QT_LIB == PYSIDE6:
-    from PySide6 import QtCore, QtGui, QtWidgets as QtWid  # type: ignore
-# pylint: enable=import-error, no-name-in-module
-# fmt: on
+# Alias
+# pylint: disable=c-extension-no-member
+if QT_LIB in (PYQT5, PYQT6):
+    QtCore.Signal = QtCore.pyqtSignal
+    QtCore.Slot = QtCore.pyqtSlot
+# pylint: enable=c-extension-no-member
 
 # \end[Mechanism to support both PyQt and PySide]
 # -----------------------------------------------
@@ -87,8 +127,12 @@ COLOR_WARNING_YELLOW = "yellow"
 #  pg.setConfigOption("background", COLOR_GRAPH_BG)
 #  pg.setConfigOption("foreground", COLOR_GRAPH_FG)
 #  PEN_01 = pg.mkPen(color=COLOR_PEN_PINK, width=3)
-COLOR_GRAPH_BG = QtGui.QColor(  0,  20,  20)  # Background
-COLOR_GRAPH_FG = QtGui.QColor(240, 240, 240)  # Foreground
+# NOTE: The `QColor`s COLOR_GRAPH_BG and COLOR_GRAPH_FG are created on first
+# access, see `__getattr__()`.
+_COLOR_GRAPH = {
+    "COLOR_GRAPH_BG": (  0,  20,  20),  # Background
+    "COLOR_GRAPH_FG": (240, 240, 240),  # Foreground
+}
 COLOR_PEN_RED       = [255,  20,  20]
 COLOR_PEN_ORANGE    = [255, 127,  39]
 COLOR_PEN_YELLOW    = [255, 255,  90]
@@ -97,112 +141,125 @@ COLOR_PEN_TURQUOISE = [  0, 255, 255]
 COLOR_PEN_BLUE      = [  0, 130, 255]
 COLOR_PEN_PINK      = [255,  30, 180]
 COLOR_PEN_WHITE     = [255, 255, 255]
+
+# Order in which traces cycle through the pen colors
+COLOR_PENS = [
+    COLOR_PEN_RED, COLOR_PEN_ORANGE, COLOR_PEN_YELLOW, COLOR_PEN_GREEN,
+    COLOR_PEN_TURQUOISE, COLOR_PEN_BLUE, COLOR_PEN_PINK, COLOR_PEN_WHITE,
+]
 # fmt: on
 
 # ------------------------------------------------------------------------------
 #   Style sheets
 # ------------------------------------------------------------------------------
 
+# Stylesheet templates by their role. The `$`-placeholders get substituted by
+# the palette of a `Theme`, see `Theme.stylesheets`.
+SS_TEMPLATES = {}
+
+# Groupbox title alignment differs between Qt5 and Qt6
+GROUP_MARGIN_TOP = "2ex" if QT_LIB in (PYQT5, PYSIDE2) else "1.2ex"
+
 # fmt: off
-SS_HOVER = (
+SS_TEMPLATES["hover"] = (
     "QLineEdit:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        "background: $COLOR_HOVER;"
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
     "QPlainTextEdit:hover {"
-        #"background: " + COLOR_HOVER + ";"  # Commented out: Ugly
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        #"background: $COLOR_HOVER;"  # Commented out: Ugly
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
     "QCheckBox:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border: 0px solid " + COLOR_HOVER_BORDER + ";}"
+        "background: $COLOR_HOVER;"
+        "border: 0px solid $COLOR_HOVER_BORDER;}"
     "QRadioButton:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border: 0px solid " + COLOR_HOVER_BORDER + ";}")
+        "background: $COLOR_HOVER;"
+        "border: 0px solid $COLOR_HOVER_BORDER;}")
 
-SS_TEXTBOX_READ_ONLY = (
+SS_TEMPLATES["textbox_read_only"] = (
     "QLineEdit {"
         "padding: 0 2px;"
         "border: 1px solid black;}"
     "QLineEdit:read-only {"
         "border: 1px solid gray;"
-        "background: " + COLOR_READ_ONLY + ";}"
+        "background: $COLOR_READ_ONLY;}"
     "QLineEdit:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        "background: $COLOR_HOVER;"
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
     "QLineEdit:read-only:hover {"
-        "background: " + COLOR_READ_ONLY + ";"
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        "background: $COLOR_READ_ONLY;"
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
 
     "QPlainTextEdit {"
         "border: 1px solid black;}"
     'QPlainTextEdit[readOnly=\"true\"] {'
-        "background-color: " + COLOR_READ_ONLY + ";"
+        "background-color: $COLOR_READ_ONLY;"
         "border: 1px solid gray;}"
     "QPlainTextEdit:hover {"
-        #"background: " + COLOR_HOVER + ";"  # Commented out: Ugly
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        #"background: $COLOR_HOVER;"  # Commented out: Ugly
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
     'QPlainTextEdit[readOnly=\"true\"]:hover {'
-        "background-color: " + COLOR_READ_ONLY + ";"
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        "background-color: $COLOR_READ_ONLY;"
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
 )
 
-SS_TEXTBOX_ERRORS = (
+SS_TEMPLATES["textbox_errors"] = (
     "QLineEdit {"
         "padding: 0 2px;"
         "border: 1px solid gray;"
-        "background: " + COLOR_READ_ONLY + ";}"
+        "background: $COLOR_READ_ONLY;}"
     "QLineEdit:hover {"
-        #"background: " + COLOR_HOVER + ";"  # Commented out: Ugly
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        #"background: $COLOR_HOVER;"  # Commented out: Ugly
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
     "QLineEdit:read-only {"
         "border: 2px solid red;"
-        "background: " + COLOR_WARNING_YELLOW + ";"
+        "background: $COLOR_WARNING_YELLOW;"
         "color: black;}"
 
     "QPlainTextEdit {"
         "border: 1px solid gray;"
-        "background-color: " + COLOR_READ_ONLY + ";}"
+        "background-color: $COLOR_READ_ONLY;}"
     "QPlainTextEdit:hover {"
-        "border: 1px solid " + COLOR_HOVER_BORDER + ";}"
+        "border: 1px solid $COLOR_HOVER_BORDER;}"
     'QPlainTextEdit[readOnly=\"true\"] {'
         "border: 2px solid red;"
-        "background-color: " + COLOR_WARNING_YELLOW + ";"
+        "background-color: $COLOR_WARNING_YELLOW;"
         "color: black;}")
 
-SS_TABS = (
+SS_TEMPLATES["tabs"] = (
     "QTabWidget::pane {"
         "border: 0px solid gray;}"
     "QTabBar::tab:selected {"
-        "background: " + COLOR_TAB_ACTIVE + "; "
-        "border-bottom-color: " + COLOR_TAB_ACTIVE + ";}"
+        "background: $COLOR_TAB_ACTIVE; "
+        "border-bottom-color: $COLOR_TAB_ACTIVE;}"
     "QTabWidget>QWidget>QWidget {"
         "border: 2px solid gray;"
-        "background: " + COLOR_TAB_ACTIVE + ";} "
+        "background: $COLOR_TAB_ACTIVE;} "
     "QTabBar::tab {"
-        "background: " + COLOR_TAB + ";"
+        "background: $COLOR_TAB;"
         "border: 2px solid gray;"
-        "border-bottom-color: " + COLOR_TAB + ";"
+        "border-bottom-color: $COLOR_TAB;"
         "border-top-left-radius: 4px;"
         "border-top-right-radius: 4px;"
         "min-width: 119px;"
         "padding: 6px;} "
     "QTabBar::tab:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border: 2px solid " + COLOR_HOVER_BORDER + ";"
-        "border-bottom-color: " + COLOR_HOVER + ";"
+        "background: $COLOR_HOVER;"
+        "border: 2px solid $COLOR_HOVER_BORDER;"
+        "border-bottom-color: $COLOR_HOVER;"
         "border-top-left-radius: 4px;"
         "border-top-right-radius: 4px;"
         "padding: 6px;} "
     "QTabWidget::tab-bar {"
         "left: 0px;}")
 
-SS_GROUP = (
+SS_TEMPLATES["group"] = (
     "QGroupBox {"
-        "background-color: " + COLOR_GROUP_BG + ";"
+        "background-color: $COLOR_GROUP_BG;"
         "border: 2px solid gray;"
         "border-radius: 5px;"
         "font: bold;"
         "padding: 8 0 0 0px;"
-        "margin-top: " + ("2ex" if QT_LIB in (PYQT5, PYSIDE2) else "1.2ex") + ";}"
+        "margin-top: $GROUP_MARGIN_TOP;}"
     "QGroupBox:title {"
         "subcontrol-origin: margin;"
         "subcontrol-position: top left;"
@@ -213,9 +270,9 @@ SS_GROUP = (
         "padding: 0;}"
 )
 
-SS_GROUP_RECT = (
+SS_TEMPLATES["group_rect"] = (
     "QGroupBox {"
-        "background-color: " + COLOR_GROUP_BG + ";"
+        "background-color: $COLOR_GROUP_BG;"
         "border: 2px solid gray;"
         "border-radius: 0px;"
         "font: bold;"
@@ -234,9 +291,9 @@ SS_GROUP_RECT = (
         "padding: 0;}"
 )
 
-SS_TITLE = (
+SS_TEMPLATES["title"] = (
     "QLabel {"
-        "background-color: " + COLOR_GROUP_BG + ";"
+        "background-color: $COLOR_GROUP_BG;"
         "padding: 10px;"
         "border-radius: 5px;"
         "font: bold;}"
@@ -247,9 +304,9 @@ SS_TITLE = (
 # ------------------------------------------------------------------------------
 
 # fmt: off
-SS_LED_INDICATOR = (
+SS_TEMPLATES["led_indicator"] = (
     "QPushButton {"
-        "background-color: " + COLOR_LED_RED + ";"
+        "background-color: $COLOR_LED_RED;"
         "color: black;"
         "border: 1px solid black;"
         "border-radius: 15px;"
@@ -258,34 +315,34 @@ SS_LED_INDICATOR = (
         "height: 30px;"
         "width: 30px;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_LED_GREEN + ";}")
+        "background-color: $COLOR_LED_GREEN;}")
 
-SS_LED_INDICATOR_RECT = (
+SS_TEMPLATES["led_indicator_rect"] = (
     "QPushButton {"
-        "background-color: " + COLOR_LED_RED + ";"
+        "background-color: $COLOR_LED_RED;"
         "color: black;"
         "border: 1px solid black;"
         "border-radius: 0px;"
         "min-height: 30px;"
         "min-width: 60px;}"  # Was 76px in v1.0
     "QPushButton:checked {"
-        "background-color: " + COLOR_LED_GREEN + ";}")
+        "background-color: $COLOR_LED_GREEN;}")
 
-SS_ERROR_LED = (
+SS_TEMPLATES["error_led"] = (
     "QPushButton {"
-        "background-color: " + COLOR_LED_GREEN + ";"
+        "background-color: $COLOR_LED_GREEN;"
         "color: black;"
         "border: 1px solid black;"
         "border-radius: 0px;"
         "min-height: 30px;"
         "min-width: 30px;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_ERROR_RED + ";"
+        "background-color: $COLOR_ERROR_RED;"
         "font-weight: bold;}")
 
-SS_TINY_LED =  (
+SS_TEMPLATES["tiny_led"] = (
     "QPushButton {"
-        "background-color: " + COLOR_LED_NEUTRAL + ";"
+        "background-color: $COLOR_LED_NEUTRAL;"
         "color: black;"
         "border: 1px solid black;"
         "border-radius: 5px;"
@@ -294,11 +351,11 @@ SS_TINY_LED =  (
         "height: 10px;"
         "width: 10px;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_LED_GREEN + ";}")
+        "background-color: $COLOR_LED_GREEN;}")
 
-SS_TINY_ERROR_LED = (
+SS_TEMPLATES["tiny_error_led"] = (
     "QPushButton {"
-        "background-color: " + COLOR_LED_NEUTRAL + ";"
+        "background-color: $COLOR_LED_NEUTRAL;"
         "color: black;"
         "border: 1px solid black;"
         "border-radius: 5px;"
@@ -307,10 +364,55 @@ SS_TINY_ERROR_LED = (
         "height: 10px;"
         "width: 10px;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_ERROR_RED + ";}")
+        "background-color: $COLOR_ERROR_RED;}")
 # fmt: on
 
 
+# Cache of the pixel width of an '8' by font, used by `e8()`. Gets cleared when
+# the application font or the DPI of a screen changes.
+_E8_ADVANCE_CACHE = {}
+_E8_CACHE_CONNECTED = False
+
+
+def _clear_e8_cache(*args):  # pylint: disable=unused-argument
+    _E8_ADVANCE_CACHE.clear()
+
+
+def _connect_e8_cache(app: QtGui.QGuiApplication):
+    """Clear the `e8()` cache whenever the font or DPI changes."""
+    global _E8_CACHE_CONNECTED  # pylint: disable=global-statement
+
+    def connect_screen(screen: QtGui.QScreen):
+        screen.logicalDotsPerInchChanged.connect(_clear_e8_cache)
+        screen.physicalDotsPerInchChanged.connect(_clear_e8_cache)
+
+    app.fontChanged.connect(_clear_e8_cache)
+    app.screenAdded.connect(connect_screen)
+    app.screenAdded.connect(_clear_e8_cache)
+    app.screenRemoved.connect(_clear_e8_cache)
+    for screen in app.screens():
+        connect_screen(screen)
+    _E8_CACHE_CONNECTED = True
+
+
+def _e8_advance(font: QtGui.QFont = None) -> int:
+    """Return the pixel width of an '8' in the supplied `font`, cached."""
+    if font is None:
+        font = QtGui.QGuiApplication.font()
+    key = font.key()
+    advance = _E8_ADVANCE_CACHE.get(key)
+    if advance is None:
+        advance = QtGui.QFontMetrics(font).horizontalAdvance("8")
+        if not _E8_CACHE_CONNECTED:
+            app = QtGui.QGuiApplication.instance()
+            if app is None:
+                # Nothing to invalidate the cache with: Do not cache
+                return advance
+            _connect_e8_cache(app)
+        _E8_ADVANCE_CACHE[key] = advance
+    return advance
+
+
 def e8(
     N: int,
     font: QtGui.QFont = None,
@@ -319,77 +421,666 @@ def e8(
     """Return the pixel width that is necessary to fit `N` number of '8's in the
     supplied `font`. In analogy to the 'em' font-metric, but now focused on
     displaying numeric values.
+
+    The font metrics are cached per font.
     """
-    if font is None:
-        font = QtGui.QGuiApplication.font()
-    qfm = QtGui.QFontMetrics(font)
-    return qfm.horizontalAdvance("8") * N + extra_padding
+    return _e8_advance(font) * N + extra_padding
+
+
+def e8_many(
+    Ns: Sequence[int],
+    font: QtGui.QFont = None,
+    extra_padding: int = 14,
+) -> List[int]:
+    """Return the pixel widths of `e8()` for each of the numbers `Ns` in one
+    go, looking up the font metrics only once.
+    """
+    advance = _e8_advance(font)
+    return [advance * N + extra_padding for N in Ns]
+
+
+def set_e8_widths(
+    widgets: Sequence[QtWid.QWidget],
+    Ns: Union[int, Sequence[int]],
+    extra_padding: int = 14,
+):
+    """Fix the width of each widget, like a `QLineEdit` showing numeric values,
+    to fit `N` number of '8's in the widget's own font. `Ns` can be a single
+    number for all widgets, or one number per widget.
+    """
+    if isinstance(Ns, int):
+        Ns = [Ns] * len(widgets)
+    if len(Ns) != len(widgets):
+        raise ValueError(
+            "Arguments `widgets` and `Ns` must be of equal length."
+        )
+
+    for widget, N in zip(widgets, Ns):
+        widget.setFixedWidth(e8(N, widget.font(), extra_padding))
+
+
+def _to_QColor(color: str) -> QtGui.QColor:
+    """Convert a stylesheet color string, like 'rgb(0, 238, 118)' or 'yellow',
+    into a `QColor`.
+    """
+    match = re.fullmatch(r"\s*rgb\(([^)]*)\)\s*", color)
+    if match:
+        r, g, b = (int(x) for x in match.group(1).split(","))
+        return QtGui.QColor(r, g, b)
+    return QtGui.QColor(color)
+
+
+# Maximum number of pre-rendered LED bodies to cache. Stretching LEDs, column
+# widths and zoom levels each render new sizes, of which only the most
+# recently used ones are kept.
+_LED_PIXMAP_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_LED_PIXMAP_CACHE_SIZE)
+def _LED_pixmap(
+    shape: str,
+    width: int,
+    height: int,
+    color: str,
+    dpr: float,
+    radius: float = 0,
+    border_color: str = "black",
+    border_width: int = 1,
+) -> QtGui.QPixmap:
+    """Return the cached pixmap of an LED body, rendering it on first use.
+    Shape "round" draws an ellipse, shape "rect" a rectangle with optionally
+    rounded corners of `radius`. The cache is shared by all `LED` instances.
+    """
+    pixmap = QtGui.QPixmap(round(width * dpr), round(height * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
+    painter = QtGui.QPainter(pixmap)
+    _draw_LED_body(
+        painter,
+        QtCore.QRectF(0, 0, width, height),
+        shape,
+        color,
+        radius,
+        border_color,
+        border_width,
+    )
+    painter.end()
+    return pixmap
+
+
+def _draw_LED_body(
+    painter: QtGui.QPainter,
+    rect: QtCore.QRectF,
+    shape: str,
+    color: str,
+    radius: float,
+    border_color: str,
+    border_width: int,
+):
+    """Draw an LED body filling `rect`, see `_LED_pixmap()`."""
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    painter.setPen(QtGui.QPen(_to_QColor(border_color), border_width))
+    painter.setBrush(_to_QColor(color))
+    half = border_width / 2
+    rect = rect.adjusted(half, half, -half, -half)
+    if shape == "round":
+        painter.drawEllipse(rect)
+    elif radius:
+        painter.drawRoundedRect(rect, radius, radius)
+    else:
+        painter.drawRect(rect)
+
+
+# Half the period of blinking `LED`s [ms]
+BLINK_INTERVAL = 500
+
+
+class _BlinkClock(QtCore.QObject):
+    """Phase clock shared by all blinking `LED`s. A single timer flips the
+    blink phase every `BLINK_INTERVAL` ms and repaints only the LEDs that are
+    currently blinking, which Qt handles in a single paint pass. The timer is
+    stopped as soon as no LED is blinking.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        # True: Blinking LEDs show their checked look, False: unchecked look
+        self.phase = True
+        self._leds = {}  # id -> weak reference to a blinking LED
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._tick)
+
+    def add(self, led: "LED"):
+        if not self._leds:
+            self.phase = True
+            self._timer.start(BLINK_INTERVAL)
+        self._leds[id(led)] = weakref.ref(led)
+
+    def remove(self, led: "LED"):
+        if self._leds.pop(id(led), None) is not None and not self._leds:
+            self._timer.stop()
+
+    def _tick(self):
+        self.phase = not self.phase
+        for key, ref in list(self._leds.items()):
+            led = ref()
+            try:
+                led.update()
+            except (AttributeError, RuntimeError):
+                # Garbage collected, or its C++ object was deleted
+                del self._leds[key]
+        if not self._leds:
+            self._timer.stop()
+
 
+# Created on first use
+_BLINK_CLOCK = None
 
-def create_LED_indicator(**kwargs) -> QtWid.QPushButton:
+
+def _blink_clock() -> _BlinkClock:
+    global _BLINK_CLOCK  # pylint: disable=global-statement
+    if _BLINK_CLOCK is None:
+        _BLINK_CLOCK = _BlinkClock()
+    return _BLINK_CLOCK
+
+
+class LED(QtWid.QWidget):
+    """Lightweight LED indicator that paints itself using cached pixmaps,
+    instead of being a stylesheet-styled `QPushButton`. Offers the same
+    `isChecked()`, `setChecked()`, `text()` and `setText()` API.
+
+    Args:
+        text (str): Label drawn centered on top of the LED.
+        checked (bool): Initial state.
+        shape (str): Either "round" for a fixed-size circle of diameter
+            `size`, or "rect" for a rectangle of height `size` that widens to
+            fit its text.
+        size (int): Diameter or height of the LED in pixels.
+        min_width (int): Minimum width of a "rect" LED in pixels.
+        color_off (str): Stylesheet color when `checked=False`.
+        color_on (str): Stylesheet color when `checked=True`.
+        bold_on (bool): Draw the text in bold when `checked=True`.
+        blinking (bool): While checked, alternate between the checked and
+            unchecked look, in phase with all other blinking LEDs. See
+            `setBlinking()`.
+    """
+
+    toggled = QtCore.Signal(bool)
+
+    def __init__(
+        self,
+        text: str = "",
+        checked: bool = False,
+        shape: str = "round",
+        size: int = 30,
+        min_width: int = 0,
+        color_off: str = COLOR_LED_RED,
+        color_on: str = COLOR_LED_GREEN,
+        bold_on: bool = False,
+        blinking: bool = False,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+
+        self._text = text
+        self._checked = checked
+        self._shape = shape
+        self._size = size
+        self._min_width = max(min_width, size)
+        self._color_off = color_off
+        self._color_on = color_on
+        self._bold_on = bold_on
+        self._blinking = False
+
+        if shape == "round":
+            self.setFixedSize(size, size)
+        else:
+            self.setSizePolicy(
+                QtWid.QSizePolicy.Policy.Minimum,
+                QtWid.QSizePolicy.Policy.Fixed,
+            )
+
+        if blinking:
+            self.setBlinking(True)
+
+    def isChecked(self) -> bool:
+        return self._checked
+
+    def setChecked(self, checked: bool):
+        checked = bool(checked)
+        if checked == self._checked:
+            return
+        self._checked = checked
+        if self._blinking:
+            self._sync_blink_clock()
+        self.update()
+        self.toggled.emit(checked)
+
+    def isBlinking(self) -> bool:
+        return self._blinking
+
+    def setBlinking(self, blinking: bool):
+        """Blink the LED while it is checked, driven by the phase clock shared
+        by all LEDs instead of a timer per LED. The checked state itself does
+        not change, and no `toggled` signals are emitted.
+        """
+        blinking = bool(blinking)
+        if blinking == self._blinking:
+            return
+        self._blinking = blinking
+        self._sync_blink_clock()
+        self.update()
+
+    def _sync_blink_clock(self):
+        if self._blinking and self._checked:
+            _blink_clock().add(self)
+        elif _BLINK_CLOCK is not None:
+            _BLINK_CLOCK.remove(self)
+
+    def isCheckable(self) -> bool:
+        return True
+
+    def setColors(self, color_off: str, color_on: str):
+        """Change the colors for `checked=False` and `checked=True`."""
+        if (color_off, color_on) == (self._color_off, self._color_on):
+            return
+        self._color_off = color_off
+        self._color_on = color_on
+        self.update()
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str):
+        if text == self._text:
+            return
+        self._text = text
+        if self._shape != "round":
+            self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QtCore.QSize:
+        if self._shape == "round":
+            return QtCore.QSize(self._size, self._size)
+
+        font = QtGui.QFont(self.font())
+        font.setBold(self._bold_on)
+        text_width = QtGui.QFontMetrics(font).horizontalAdvance(self._text)
+        return QtCore.QSize(max(self._min_width, text_width + 12), self._size)
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return self.sizeHint()
+
+    def paintEvent(self, event):  # pylint: disable=unused-argument
+        checked = self._checked
+        if checked and self._blinking and not _BLINK_CLOCK.phase:
+            checked = False
+
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(
+            0,
+            0,
+            _LED_pixmap(
+                self._shape,
+                self.width(),
+                self.height(),
+                self._color_on if checked else self._color_off,
+                self.devicePixelRatioF(),
+            ),
+        )
+
+        if self._text:
+            if self._bold_on and checked:
+                font = QtGui.QFont(self.font())
+                font.setBold(True)
+                painter.setFont(font)
+            painter.setPen(QtGui.QColor("black"))
+            painter.drawText(
+                self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, self._text
+            )
+
+
+# Painted counterparts of the LED stylesheets by their role. The colors refer to
+# entries of the palette of the current `Theme`.
+_PAINTED_LEDS = {
+    "led_indicator": dict(
+        shape="round",
+        size=30,
+        color_off="COLOR_LED_RED",
+        color_on="COLOR_LED_GREEN",
+    ),
+    "led_indicator_rect": dict(
+        shape="rect",
+        size=30,
+        min_width=60,
+        color_off="COLOR_LED_RED",
+        color_on="COLOR_LED_GREEN",
+    ),
+    "error_led": dict(
+        shape="rect",
+        size=30,
+        color_off="COLOR_LED_GREEN",
+        color_on="COLOR_ERROR_RED",
+        bold_on=True,
+    ),
+    "tiny_led": dict(
+        shape="round",
+        size=10,
+        color_off="COLOR_LED_NEUTRAL",
+        color_on="COLOR_LED_GREEN",
+    ),
+    "tiny_error_led": dict(
+        shape="round",
+        size=10,
+        color_off="COLOR_LED_NEUTRAL",
+        color_on="COLOR_ERROR_RED",
+    ),
+}
+
+
+def _create_painted_LED(role: str, **kwargs) -> LED:
+    LED_args = dict(_PAINTED_LEDS[role])
+    LED_args["color_off"] = getattr(_THEME, LED_args["color_off"])
+    LED_args["color_on"] = getattr(_THEME, LED_args["color_on"])
+    led = LED(**LED_args, **kwargs)
+    led.setProperty(DVG_ROLE, role)
+    return led
+
+
+def create_LED_indicator(
+    painted: bool = False, **kwargs
+) -> Union[QtWid.QPushButton, LED]:
     """Useful kwargs:
       text: str, icon: QIcon, checked: bool, parent
 
     checked=False -> LED red
     checked=True  -> LED green
+
+    painted=True -> Return a lightweight, self-painting `LED` widget instead
     """
+    if painted:
+        return _create_painted_LED("led_indicator", **kwargs)
+
     button = QtWid.QPushButton(checkable=True, enabled=False, **kwargs)
-    button.setStyleSheet(SS_LED_INDICATOR)
+    _style_control(button, "led_indicator")
     return button
 
 
-def create_LED_indicator_rect(**kwargs) -> QtWid.QPushButton:
+def create_LED_indicator_rect(
+    painted: bool = False, **kwargs
+) -> Union[QtWid.QPushButton, LED]:
     """
     Useful kwargs:
       text: str, icon: QIcon, checked: bool, parent
 
     checked=False -> LED red
     checked=True  -> LED green
+
+    painted=True -> Return a lightweight, self-painting `LED` widget instead
     """
+    if painted:
+        return _create_painted_LED("led_indicator_rect", **kwargs)
+
     button = QtWid.QPushButton(checkable=True, enabled=False, **kwargs)
-    button.setStyleSheet(SS_LED_INDICATOR_RECT)
+    _style_control(button, "led_indicator_rect")
     return button
 
 
-def create_error_LED(**kwargs) -> QtWid.QPushButton:
+def create_error_LED(
+    painted: bool = False, **kwargs
+) -> Union[QtWid.QPushButton, LED]:
     """
     Useful kwargs:
       text: str, icon: QIcon, checked: bool, parent
 
     checked=False -> LED green
     checked=True  -> error red
+
+    painted=True -> Return a lightweight, self-painting `LED` widget instead,
+    which also accepts `blinking=True` to blink while in error
     """
+    if painted:
+        return _create_painted_LED("error_led", **kwargs)
+
     button = QtWid.QPushButton(checkable=True, enabled=False, **kwargs)
-    button.setStyleSheet(SS_ERROR_LED)
+    _style_control(button, "error_led")
     return button
 
 
-def create_tiny_LED(**kwargs) -> QtWid.QPushButton:
+def create_tiny_LED(
+    painted: bool = False, **kwargs
+) -> Union[QtWid.QPushButton, LED]:
     """
     Useful kwargs:
       text: str, icon: QIcon, checked: bool, parent
 
     checked=False -> LED neutral
     checked=True  -> LED green
+
+    painted=True -> Return a lightweight, self-painting `LED` widget instead
     """
+    if painted:
+        return _create_painted_LED("tiny_led", **kwargs)
+
     button = QtWid.QPushButton(checkable=True, enabled=False, **kwargs)
-    button.setStyleSheet(SS_TINY_LED)
+    _style_control(button, "tiny_led")
     return button
 
 
-def create_tiny_error_LED(**kwargs) -> QtWid.QPushButton:
+def create_tiny_error_LED(
+    painted: bool = False, **kwargs
+) -> Union[QtWid.QPushButton, LED]:
     """
     Useful kwargs:
       text: str, icon: QIcon, checked: bool, parent
 
     checked=False -> LED neutral
     checked=True  -> error red
+
+    painted=True -> Return a lightweight, self-painting `LED` widget instead,
+    which also accepts `blinking=True` to blink while in error
     """
+    if painted:
+        return _create_painted_LED("tiny_error_led", **kwargs)
+
     button = QtWid.QPushButton(checkable=True, enabled=False, **kwargs)
-    button.setStyleSheet(SS_TINY_ERROR_LED)
+    _style_control(button, "tiny_error_led")
     return button
 
 
+# ------------------------------------------------------------------------------
+#   LED matrix
+# ------------------------------------------------------------------------------
+
+# Default mapping of state codes to colors used by `LEDMatrix`, as entries of
+# the palette of the current `Theme`
+LED_MATRIX_COLORS = {
+    0: "COLOR_LED_NEUTRAL",
+    1: "COLOR_LED_GREEN",
+    2: "COLOR_LED_RED",
+    3: "COLOR_ERROR_RED",
+}
+
+
+class LEDMatrix(QtWid.QWidget):
+    """Grid of LEDs driven directly by a 2D NumPy array of booleans or small
+    integer state codes. The whole grid is rendered into a single `QImage` and
+    only the cells that changed state get redrawn.
+
+    Requires NumPy.
+
+    Args:
+        rows (int): Number of rows of the grid.
+        cols (int): Number of columns of the grid.
+        cell_size (int): Diameter or side of a single LED in pixels.
+        spacing (int): Spacing between LEDs in pixels.
+        shape (str): Either "round" or "rect".
+        colors (dict): Mapping of state code to a palette entry of the theme,
+            like "COLOR_LED_GREEN", or to a stylesheet color. Booleans map to
+            the state codes 0 and 1. Defaults to `LED_MATRIX_COLORS`.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        cell_size: int = 10,
+        spacing: int = 2,
+        shape: str = "round",
+        colors: dict = None,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self._np = np
+        self._states = np.zeros((rows, cols), dtype=np.uint8)
+        self._cell_size = cell_size
+        self._pitch = cell_size + spacing
+        self._shape = shape
+        self._colors = dict(LED_MATRIX_COLORS if colors is None else colors)
+        self._image = None  # Rendered lazily, see `_render_image()`
+
+        self.setFixedSize(
+            cols * self._pitch - spacing, rows * self._pitch - spacing
+        )
+
+    @property
+    def states(self):
+        """Copy of the current state array."""
+        return self._states.copy()
+
+    def set_states(self, states) -> int:
+        """Update the grid to match the array `states`, which must have the
+        same number of elements as the grid. Only changed cells get redrawn.
+        State codes without a color are shown in the neutral color.
+
+        Returns:
+            The number of cells that changed state.
+
+        Raises:
+            ValueError: When a state code is not an integer from 0 to 255.
+        """
+        np = self._np
+        states = np.asarray(states)
+        if states.dtype != np.uint8 and states.size:
+            if states.min() < 0 or states.max() > 255:
+                raise ValueError("State codes must be in the range 0 to 255.")
+            if states.dtype.kind == "f" and np.any(states % 1):
+                raise ValueError("State codes must be integers.")
+            states = states.astype(np.uint8)
+        if states.size != self._states.size:
+            raise ValueError(
+                f"Expected an array of shape {self._states.shape}, "
+                f"got {states.shape}."
+            )
+        states = states.reshape(self._states.shape)
+
+        rows, cols = np.nonzero(states != self._states)
+        N_changed = len(rows)
+        if N_changed == 0:
+            return 0
+
+        self._states[rows, cols] = states[rows, cols]
+        if self._image is None:
+            return N_changed
+
+        self._paint_cells(rows, cols)
+        if N_changed > self._states.size // 4:
+            self.update()
+        else:
+            region = QtGui.QRegion()
+            for row, col in zip(rows.tolist(), cols.tolist()):
+                region += QtCore.QRect(
+                    col * self._pitch,
+                    row * self._pitch,
+                    self._cell_size,
+                    self._cell_size,
+                )
+            self.update(region)
+
+        return N_changed
+
+    def _palette_keys(self) -> set:
+        """Return the palette entries of the theme used by this matrix."""
+        return {
+            color
+            for color in list(self._colors.values()) + ["COLOR_LED_NEUTRAL"]
+            if color in DEFAULT_PALETTE
+        }
+
+    def _color(self, state: int) -> str:
+        color = self._colors.get(state, "COLOR_LED_NEUTRAL")
+        return getattr(_THEME, color) if color in DEFAULT_PALETTE else color
+
+    def _rerender(self):
+        """Redraw all cells, e.g. after the theme changed."""
+        self._image = None
+        self.update()
+
+    def _paint_cells(self, rows, cols):
+        """Redraw the given cells into the backing image, grouped per state
+        code so that each color's pixmap is fetched only once.
+        """
+        dpr = self._image.devicePixelRatio()
+        cell_states = self._states[rows, cols]
+        painter = QtGui.QPainter(self._image)
+        painter.setCompositionMode(
+            QtGui.QPainter.CompositionMode.CompositionMode_Source
+        )
+        for state in self._np.unique(cell_states).tolist():
+            pixmap = _LED_pixmap(
+                self._shape,
+                self._cell_size,
+                self._cell_size,
+                self._color(state),
+                dpr,
+            )
+            mask = cell_states == state
+            for row, col in zip(rows[mask].tolist(), cols[mask].tolist()):
+                painter.drawPixmap(col * self._pitch, row * self._pitch, pixmap)
+        painter.end()
+
+    def _render_image(self):
+        """(Re)create the backing image at the current device pixel ratio."""
+        dpr = self.devicePixelRatioF()
+        self._image = QtGui.QImage(
+            round(self.width() * dpr),
+            round(self.height() * dpr),
+            QtGui.QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        self._image.setDevicePixelRatio(dpr)
+        self._image.fill(QtCore.Qt.GlobalColor.transparent)
+        rows, cols = self._np.indices(self._states.shape)
+        self._paint_cells(rows.ravel(), cols.ravel())
+
+    def paintEvent(self, event):
+        if (
+            self._image is None
+            or self._image.devicePixelRatio() != self.devicePixelRatioF()
+        ):
+            self._render_image()
+
+        painter = QtGui.QPainter(self)
+        rect = event.rect()
+        painter.drawImage(rect, self._image, self._image_rect(rect))
+
+    def _image_rect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        """Map a widget rectangle to device pixels in the backing image."""
+        dpr = self._image.devicePixelRatio()
+        return QtCore.QRect(
+            round(rect.x() * dpr),
+            round(rect.y() * dpr),
+            round(rect.width() * dpr),
+            round(rect.height() * dpr),
+        )
+
+
 # ------------------------------------------------------------------------------
 #   Toggle buttons
 # ------------------------------------------------------------------------------
@@ -399,9 +1090,9 @@ DFLT_TOGGLE_BTN_BORDER_WIDTH = "2px"
 DFLT_TOGGLE_BTN_BORDER_RADIUS = "5px"
 
 # fmt: off
-SS_RELAY_BUTTON = (
+SS_TEMPLATES["relay_button"] = (
     "QPushButton {"
-        "background-color: " + COLOR_LED_RED + ";"
+        "background-color: $COLOR_LED_RED;"
         "border-style: inset;"
         "border-width: 1px;"
         "max-height: 30px;"
@@ -417,71 +1108,81 @@ SS_RELAY_BUTTON = (
         "color: black;}"
     "QPushButton:checked {"
         "border-style: outset;"
-        "background-color: " + COLOR_LED_GREEN + ";}")
+        "background-color: $COLOR_LED_GREEN;}")
+
+# Look of a `RelayButton` while its command is running
+SS_TEMPLATES["relay_button_pending"] = (
+    "QPushButton {"
+        "background-color: $COLOR_WARNING_YELLOW;"
+        "border: 1px dashed black;"
+        "max-height: 30px;"
+        "max-width: 30px;"
+        "height: 30px;"
+        "width: 30px;}")
 
-SS_TOGGLE_BUTTON = (
+SS_TEMPLATES["toggle_button"] = (
     "QPushButton {"
-        "background-color: " + COLOR_BG + ";"
+        "background-color: $COLOR_BG;"
         "border-style: outset;"
         "border-color: gray dimgray dimgray gray;"
-        "border-width: " + DFLT_TOGGLE_BTN_BORDER_WIDTH + ";"
-        "border-radius: " + DFLT_TOGGLE_BTN_BORDER_RADIUS + ";"
+        "border-width: $DFLT_TOGGLE_BTN_BORDER_WIDTH;"
+        "border-radius: $DFLT_TOGGLE_BTN_BORDER_RADIUS;"
         "color: black;"
-        "padding: " + DFLT_TOGGLE_BTN_PADDING + ";}"
+        "padding: $DFLT_TOGGLE_BTN_PADDING;}"
     "QPushButton:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border-color: " + COLOR_HOVER_BORDER + ";}"
+        "background: $COLOR_HOVER;"
+        "border-color: $COLOR_HOVER_BORDER;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_LED_GREEN + ";"
+        "background-color: $COLOR_LED_GREEN;"
         "border-style: inset;"
         "border-color: dimgray mediumspringgreen mediumspringgreen dimgray;}"
     "QPushButton:checked:hover {"
-        "border-color: " + COLOR_HOVER_BORDER + ";}"
+        "border-color: $COLOR_HOVER_BORDER;}"
     "QPushButton:disabled {"
         "color: dimgrey;}")
 
-SS_TOGGLE_BUTTON_2 = (
+SS_TEMPLATES["toggle_button_2"] = (
     "QPushButton {"
-        "background-color: " + COLOR_BG + ";"
+        "background-color: $COLOR_BG;"
         "border-style: outset;"
         "border-color: gray dimgray dimgray gray;"
-        "border-width: " + DFLT_TOGGLE_BTN_BORDER_WIDTH + ";"
-        "border-radius: " + DFLT_TOGGLE_BTN_BORDER_RADIUS + ";"
+        "border-width: $DFLT_TOGGLE_BTN_BORDER_WIDTH;"
+        "border-radius: $DFLT_TOGGLE_BTN_BORDER_RADIUS;"
         "color: black;"
-        "padding: " + DFLT_TOGGLE_BTN_PADDING + ";}"
+        "padding: $DFLT_TOGGLE_BTN_PADDING;}"
     "QPushButton:hover {"
-        "background: " + COLOR_HOVER + ";"
-        "border-color: " + COLOR_HOVER_BORDER + ";}"
+        "background: $COLOR_HOVER;"
+        "border-color: $COLOR_HOVER_BORDER;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_WARNING_YELLOW + ";"
+        "background-color: $COLOR_WARNING_YELLOW;"
         "border-style: groove;"
         "border-color: firebrick red red firebrick;"
         "font-weight: bold;}"
     "QPushButton:checked:hover {"
-        "border-color: " + COLOR_HOVER_BORDER + ";}"
+        "border-color: $COLOR_HOVER_BORDER;}"
     "QPushButton:disabled {"
         "color: dimgray;}")
 
-SS_TOGGLE_BUTTON_3 = (
+SS_TEMPLATES["toggle_button_3"] = (
     "QPushButton {"
-        "background-color: " + COLOR_WARNING_YELLOW +";"
+        "background-color: $COLOR_WARNING_YELLOW;"
         "border-style: ridge;"
         "border-color: red firebrick firebrick red;"
-        "border-width: " + DFLT_TOGGLE_BTN_BORDER_WIDTH + ";"
-        "border-radius: " + DFLT_TOGGLE_BTN_BORDER_RADIUS + ";"
+        "border-width: $DFLT_TOGGLE_BTN_BORDER_WIDTH;"
+        "border-radius: $DFLT_TOGGLE_BTN_BORDER_RADIUS;"
         "color: black;"
-        "padding: " + DFLT_TOGGLE_BTN_PADDING + ";"
+        "padding: $DFLT_TOGGLE_BTN_PADDING;"
         "font-weight: bold;}"
     "QPushButton:hover {"
-        "border-color: " + COLOR_HOVER_BORDER + ";}"
+        "border-color: $COLOR_HOVER_BORDER;}"
     "QPushButton:checked {"
-        "background-color: " + COLOR_LED_GREEN + ";"
+        "background-color: $COLOR_LED_GREEN;"
         "border-style: inset;"
         "border-color: dimgray mediumspringgreen mediumspringgreen dimgray;"
-        "border-width: " + DFLT_TOGGLE_BTN_BORDER_WIDTH + ";"
+        "border-width: $DFLT_TOGGLE_BTN_BORDER_WIDTH;"
         "font-weight: normal;}"
     "QPushButton:checked:hover {"
-        "border-color: " + COLOR_HOVER_BORDER + ";}"
+        "border-color: $COLOR_HOVER_BORDER;}"
     "QPushButton:disabled {"
         "color: dimgray;}")
 # fmt: on
@@ -496,8 +1197,8 @@ def create_Relay_button(text: str = "", **kwargs) -> QtWid.QPushButton:
     checked=True  -> LED green
     """
     button = QtWid.QPushButton(text=text, checkable=True, **kwargs)
-    button.setStyleSheet(SS_RELAY_BUTTON)
-    button.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+    _style_control(button, "relay_button")
+    button.setCursor(_pointing_hand_cursor())
 
     # NOTE: Do not enable below code. There is a good reason to not change the
     # relay button label immediately at click. The text-value "0" or "1" can
@@ -521,8 +1222,8 @@ def create_Toggle_button(text: str = "", **kwargs) -> QtWid.QPushButton:
     checked=True  -> LED green
     """
     button = QtWid.QPushButton(text=text, checkable=True, **kwargs)
-    button.setStyleSheet(SS_TOGGLE_BUTTON)
-    button.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+    _style_control(button, "toggle_button")
+    button.setCursor(_pointing_hand_cursor())
     return button
 
 
@@ -535,8 +1236,8 @@ def create_Toggle_button_2(text: str = "", **kwargs) -> QtWid.QPushButton:
     checked=True  -> red-lined warning yellow
     """
     button = QtWid.QPushButton(text=text, checkable=True, **kwargs)
-    button.setStyleSheet(SS_TOGGLE_BUTTON_2)
-    button.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+    _style_control(button, "toggle_button_2")
+    button.setCursor(_pointing_hand_cursor())
     return button
 
 
@@ -549,6 +1250,3642 @@ def create_Toggle_button_3(text: str = "", **kwargs) -> QtWid.QPushButton:
     checked=True  -> LED green
     """
     button = QtWid.QPushButton(text=text, checkable=True, **kwargs)
-    button.setStyleSheet(SS_TOGGLE_BUTTON_3)
-    button.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+    _style_control(button, "toggle_button_3")
+    button.setCursor(_pointing_hand_cursor())
     return button
+
+
+# ------------------------------------------------------------------------------
+#   Relay button
+# ------------------------------------------------------------------------------
+
+# Thread pool shared by all `RelayButton`s without an executor of their own,
+# created on first use. NOTE: `asyncio`, `concurrent.futures` and `inspect` are
+# imported only when needed, because they are slow to import.
+_RELAY_EXECUTOR = None
+
+
+def _relay_executor():
+    global _RELAY_EXECUTOR  # pylint: disable=global-statement
+    if _RELAY_EXECUTOR is None:
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor
+
+        _RELAY_EXECUTOR = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="dvg_relay"
+        )
+    return _RELAY_EXECUTOR
+
+
+def _run_command(command: Callable, state: bool):
+    """Run `command(state)` in a worker thread, including coroutines."""
+    import asyncio  # pylint: disable=import-outside-toplevel
+    import inspect  # pylint: disable=import-outside-toplevel
+
+    result = command(state)
+    if inspect.isawaitable(result):
+
+        async def wait_for():
+            return await result
+
+        result = asyncio.run(wait_for())
+    return result
+
+
+def _is_coroutine_function(function: Callable) -> bool:
+    import inspect  # pylint: disable=import-outside-toplevel
+
+    return inspect.iscoroutinefunction(function)
+
+
+class RelayButton(QtWid.QPushButton):
+    """Relay button, looking like `create_Relay_button()`, that performs the
+    actual relay operation by itself without blocking the GUI thread.
+
+    A click does not toggle the button right away. Instead, `command(state)` is
+    run with the requested state on a thread pool, during which the button
+    shows a pending look. Once the command succeeds, the checked state and the
+    label "0"/"1" are committed. When it fails or times out, the button rolls
+    back to its previous state. A command that timed out can not be stopped,
+    so the button keeps its pending look until that command has actually
+    finished. Hence, a button never runs two commands at once.
+
+    Clicks arriving while a command is pending toggle the most recently
+    requested state, so that a pending switch can be reversed. They are
+    coalesced: Only the last requested state is kept, and is sent once the
+    running command finishes, unless it equals the resulting state.
+
+    The command can be a regular function or a coroutine function. Coroutines
+    run in a fresh event loop inside the worker thread, or, when `loop` is
+    given, are scheduled onto that already running asyncio loop, like one
+    integrated with Qt. The command is deemed successful unless it raises an
+    exception or returns False.
+
+    Signals:
+        commandFinished(bool state, bool success): Emitted when a command
+            finishes, fails or times out.
+
+    Args:
+        command (callable): Function `command(state: bool)` operating the relay.
+        timeout (float): Seconds after which a pending command is considered
+            failed. None for no timeout.
+        executor (concurrent.futures.Executor): Executor to run the command
+            with. Defaults to a thread pool shared by all relay buttons. Pass
+            an executor with a single worker to serialize access to a device.
+        loop (asyncio.AbstractEventLoop): Running event loop to schedule
+            coroutines onto, instead of running them in the executor.
+        text_off (str): Label when `checked=False`.
+        text_on (str): Label when `checked=True`.
+    """
+
+    commandFinished = QtCore.Signal(bool, bool)
+    _commandDone = QtCore.Signal(int, bool, object)  # token, success, error
+
+    def __init__(
+        self,
+        command: Callable,
+        timeout: Optional[float] = 5.0,
+        executor=None,
+        loop=None,
+        text_off: str = "0",
+        text_on: str = "1",
+        checked: bool = False,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, checkable=True, checked=checked, **kwargs)
+
+        self._command = command
+        self._timeout = timeout
+        self._executor = executor
+        self._loop = loop
+        self._text_off = text_off
+        self._text_on = text_on
+
+        self._token = 0  # Identifies the command in flight
+        self._future = None
+        self._requested = None  # State requested by the command in flight
+        self._queued = None  # Last state requested while pending
+        self.N_coalesced = 0
+        self.last_error = None
+
+        self._timeout_timer = QtCore.QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_timeout)
+        self._commandDone.connect(self._on_command_done)
+
+        _style_control(self, "relay_button")
+        self.setCursor(_pointing_hand_cursor())
+        self.setText(text_on if checked else text_off)
+
+    def is_pending(self) -> bool:
+        """Return whether a command is running, including one that timed out
+        but did not finish yet.
+        """
+        return self._future is not None
+
+    def request(self, state: bool):
+        """Request the relay to switch to `state`, like a click would."""
+        state = bool(state)
+        if self._future is not None:
+            if self._queued is not None:
+                self.N_coalesced += 1
+            self._queued = state
+            return
+        if state != self.isChecked():
+            self._start(state)
+
+    def nextCheckState(self):
+        # Called by Qt on a click. Toggle against the most recently requested
+        # state, and defer the toggle until the command succeeds.
+        if self._queued is not None:
+            state = self._queued
+        elif self._requested is not None:
+            state = self._requested
+        else:
+            state = self.isChecked()
+        self.request(not state)
+
+    def _start(self, state: bool):
+        self._token += 1
+        token = self._token
+        self._requested = state
+        _style_control(self, "relay_button_pending")
+
+        if self._loop is not None and _is_coroutine_function(self._command):
+            import asyncio  # pylint: disable=import-outside-toplevel
+
+            future = asyncio.run_coroutine_threadsafe(
+                self._command(state), self._loop
+            )
+        else:
+            executor = self._executor or _relay_executor()
+            future = executor.submit(_run_command, self._command, state)
+
+        def done(future):
+            # Runs in a worker thread: Hand over to the GUI thread
+            if future.cancelled():
+                success, error = False, None
+            else:
+                error = future.exception()
+                success = error is None and future.result() is not False
+            self._commandDone.emit(token, success, error)
+
+        self._future = future
+        if self._timeout is not None:
+            self._timeout_timer.start(round(self._timeout * 1000))
+        future.add_done_callback(done)
+
+    @QtCore.Slot(int, bool, object)
+    def _on_command_done(self, token: int, success: bool, error):
+        if token != self._token or self._future is None:
+            return
+        if self._requested is not None:
+            self._finish(success, error)
+        else:
+            # The command that timed out has finished after all
+            self._future = None
+            self._start_queued()
+
+    @QtCore.Slot()
+    def _on_timeout(self):
+        if self._requested is None:
+            return
+        future = self._future
+        self._finish(
+            False, TimeoutError(f"Relay command timed out ({self._timeout} s)")
+        )
+        future.cancel()
+
+    def _finish(self, success: bool, error):
+        self._timeout_timer.stop()
+        state = self._requested
+        self._requested = None
+        self.last_error = error
+
+        if success:
+            self.setChecked(state)
+        self.setText(self._text_on if self.isChecked() else self._text_off)
+        self.commandFinished.emit(state, success)
+
+        # A command that timed out keeps running. Wait for it to finish before
+        # starting the next one.
+        if self._future.done():
+            self._future = None
+            self._start_queued()
+
+    def _start_queued(self):
+        queued, self._queued = self._queued, None
+        if queued is not None and queued != self.isChecked():
+            self._start(queued)
+        else:
+            _style_control(self, "relay_button")
+
+
+# ------------------------------------------------------------------------------
+#   Command throttling
+# ------------------------------------------------------------------------------
+
+
+class CommandThrottle(QtCore.QObject):
+    """Rate limiter between the clicks on a toggle or relay button made by the
+    `create_*` factories and the commands sent to a slow device. Connect to
+    signal `commandRequested` instead of to the `clicked` signal of the
+    button.
+
+    In throttle mode at most one command is requested per `interval`. In
+    debounce mode a command is only requested once the clicks have stopped
+    for `interval`. With `leading=True` the first click requests its command
+    right away, with `trailing=True` the last click within the interval
+    requests its command when the interval ends. Only the last pending state
+    is kept, and a trailing command is skipped when it equals the state
+    requested last. Clicks that do not lead to a command are counted as
+    `suppressed`.
+
+    The throttle is a child of the button and gets deleted along with it, or
+    by `detach()`. `ControlPool.release()` detaches the throttles of a
+    released button.
+
+    Usage:
+        button = create_Toggle_button("Off")
+        throttle = CommandThrottle(button, interval=500)
+        throttle.commandRequested.connect(device.set_pump)
+
+    Signals:
+        commandRequested(bool state): Emitted at the throttled rate with the
+            checked state of the button to send to the device.
+
+    Args:
+        button (QAbstractButton): The checkable button to throttle.
+        interval (int): Minimum interval [ms] between commands, or the quiet
+            time [ms] in debounce mode.
+        leading (bool): Request the command of the first click right away.
+        trailing (bool): Request the command of the last click at the end of
+            the interval.
+        debounce (bool): Debounce instead of throttle.
+    """
+
+    commandRequested = QtCore.Signal(bool)
+
+    def __init__(
+        self,
+        button: QtWid.QAbstractButton,
+        interval: int = 250,
+        leading: bool = True,
+        trailing: bool = True,
+        debounce: bool = False,
+    ):
+        super().__init__(button)
+        if not (leading or trailing):
+            raise ValueError(
+                "At least one of `leading` and `trailing` must be True."
+            )
+
+        self._leading = leading
+        self._trailing = trailing
+        self._debounce = debounce
+        self._pending = None  # Last state clicked during the interval
+        self._last_requested = None
+
+        self._N_clicks = 0
+        self._N_requested = 0
+        self._N_suppressed = 0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._on_timeout)
+        button.clicked.connect(self._on_clicked)
+
+    def set_interval(self, interval: int):
+        self._timer.setInterval(interval)
+
+    def is_pending(self) -> bool:
+        """Return whether a trailing command is waiting for the interval to
+        end.
+        """
+        return self._pending is not None
+
+    def _request(self, state: bool):
+        self._last_requested = state
+        self._N_requested += 1
+        self.commandRequested.emit(state)
+
+    @QtCore.Slot(bool)
+    def _on_clicked(self, state: bool):
+        self._N_clicks += 1
+        if not self._timer.isActive():
+            if self._leading:
+                self._request(state)
+            else:
+                self._pending = state
+            self._timer.start()
+            return
+
+        if self._pending is not None:
+            self._N_suppressed += 1
+        self._pending = state
+        if self._debounce:
+            # Wait for the clicks to stop
+            self._timer.start()
+
+    @QtCore.Slot()
+    def _on_timeout(self):
+        if self._pending is None:
+            return
+        state, self._pending = self._pending, None
+        if self._trailing and state != self._last_requested:
+            self._request(state)
+            if not self._debounce:
+                # Keep the minimum interval to the next command
+                self._timer.start()
+        else:
+            self._N_suppressed += 1
+
+    def flush(self):
+        """Request the pending command right away, if any."""
+        self._timer.stop()
+        self._on_timeout()
+
+    def counters(self) -> dict:
+        """Return a snapshot of the counters `clicks`, `requested` commands,
+        `suppressed` clicks and whether a command is `pending`.
+        """
+        return {
+            "clicks": self._N_clicks,
+            "requested": self._N_requested,
+            "suppressed": self._N_suppressed,
+            "pending": self._pending is not None,
+        }
+
+    def reset_counters(self):
+        self._N_clicks = 0
+        self._N_requested = 0
+        self._N_suppressed = 0
+
+    def detach(self):
+        """Stop throttling the button, dropping a pending command, and delete
+        this throttle.
+        """
+        self._timer.stop()
+        self._pending = None
+        button = self.parent()
+        if button is not None:
+            try:
+                button.clicked.disconnect(self._on_clicked)
+            except (TypeError, RuntimeError):
+                # Disconnected already
+                pass
+            self.setParent(None)
+        self.deleteLater()
+
+
+# ------------------------------------------------------------------------------
+#   Numeric readout
+# ------------------------------------------------------------------------------
+
+# Characters that `NumericReadout` draws from pre-rendered glyphs
+_READOUT_GLYPHS = "0123456789+-.,:eE %"
+
+# Cache of the pre-rendered glyphs, shared by all `NumericReadout` instances.
+# Key: (font key, device pixel ratio), value: ({char: pixmap}, {char: advance})
+_READOUT_GLYPH_CACHE = {}
+
+
+def _readout_glyphs(font: QtGui.QFont, dpr: float) -> tuple:
+    """Return the cached glyph pixmaps and advances of `_READOUT_GLYPHS`,
+    rendering them on first use.
+    """
+    key = (font.key(), dpr)
+    glyphs = _READOUT_GLYPH_CACHE.get(key)
+    if glyphs is not None:
+        return glyphs
+
+    qfm = QtGui.QFontMetrics(font)
+    height = qfm.height()
+    pixmaps = {}
+    advances = {}
+    for char in _READOUT_GLYPHS:
+        advance = qfm.horizontalAdvance(char)
+        pixmap = QtGui.QPixmap(
+            max(1, round(advance * dpr)), max(1, round(height * dpr))
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor("black"))
+        painter.drawText(0, qfm.ascent(), char)
+        painter.end()
+        pixmaps[char] = pixmap
+        advances[char] = advance
+
+    glyphs = (pixmaps, advances)
+    _READOUT_GLYPH_CACHE[key] = glyphs
+    return glyphs
+
+
+def _aligned_x(text_rect: QtCore.QRectF, width: float, alignment) -> float:
+    """Left x-coordinate of text of `width` aligned within `text_rect`."""
+    if alignment & QtCore.Qt.AlignmentFlag.AlignRight:
+        return text_rect.right() - width
+    if alignment & QtCore.Qt.AlignmentFlag.AlignHCenter:
+        return text_rect.left() + (text_rect.width() - width) / 2
+    return text_rect.left()
+
+
+def _draw_glyphs(
+    painter: QtGui.QPainter,
+    text_rect: QtCore.QRectF,
+    y: float,
+    text: str,
+    font: QtGui.QFont,
+    alignment,
+    dpr: float,
+) -> bool:
+    """Draw `text` at height `y` from the cached glyphs of `_readout_glyphs()`.
+    Returns False, without drawing anything, when `text` contains characters
+    that have no cached glyph.
+    """
+    if not all(char in _READOUT_GLYPHS for char in text):
+        return False
+
+    pixmaps, advances = _readout_glyphs(font, dpr)
+    x = _aligned_x(text_rect, sum(advances[char] for char in text), alignment)
+    for char in text:
+        painter.drawPixmap(QtCore.QPointF(x, y), pixmaps[char])
+        x += advances[char]
+    return True
+
+
+class NumericReadout(QtWid.QWidget):
+    """Read-only display of a numeric value, intended for values that update at
+    a high rate. It looks like a `QLineEdit` styled with `SS_TEXTBOX_READ_ONLY`,
+    or with `SS_TEXTBOX_ERRORS` when in the error state.
+
+    The value is formatted with a `str.format()`-style template that is
+    compiled once. Updates that result in the same text are skipped entirely.
+    Text consisting of digits and common numeric characters is drawn from
+    cached glyph pixmaps, other text is drawn using a `QStaticText`.
+
+    Args:
+        fmt (str): Format template with a single field, e.g. "{:.3f}" or
+            "{:.1f} °C".
+        N (int): Width of the readout expressed as the number of '8's to fit,
+            see `e8()`.
+        error (bool): Show the error look of `SS_TEXTBOX_ERRORS`.
+        alignment (QtCore.Qt.AlignmentFlag): Horizontal alignment of the text.
+    """
+
+    def __init__(
+        self,
+        fmt: str = "{:.3f}",
+        N: int = 8,
+        error: bool = False,
+        alignment=QtCore.Qt.AlignmentFlag.AlignRight,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+
+        self._format = fmt.format
+        self._N = N
+        self._error = error
+        self._alignment = alignment
+        self._value = None
+        self._text = ""
+        self._static_text = None  # Only used for text without cached glyphs
+
+        self.setSizePolicy(
+            QtWid.QSizePolicy.Policy.Fixed, QtWid.QSizePolicy.Policy.Fixed
+        )
+
+    def value(self):
+        return self._value
+
+    def set_value(self, value) -> bool:
+        """Show `value` formatted by the format template.
+
+        Returns:
+            True when the displayed text changed, False when the update got
+            skipped because the text stayed the same.
+        """
+        self._value = value
+        return self.setText(self._format(value))
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str) -> bool:
+        """Show arbitrary text. Returns True when the displayed text changed."""
+        if text == self._text:
+            return False
+        self._text = text
+        self._static_text = None
+        self.update()
+        return True
+
+    def is_error(self) -> bool:
+        return self._error
+
+    def set_error(self, error: bool):
+        """Toggle the error look of `SS_TEXTBOX_ERRORS`."""
+        error = bool(error)
+        if error != self._error:
+            self._error = error
+            self.update()
+
+    def sizeHint(self) -> QtCore.QSize:
+        # Border of 2 px plus padding of 2 px at both sides
+        return QtCore.QSize(
+            e8(self._N, self.font(), extra_padding=8),
+            self.fontMetrics().height() + 8,
+        )
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return self.sizeHint()
+
+    def enterEvent(self, event):
+        super().enterEvent(event)
+        self.update()
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.update()
+
+    def paintEvent(self, event):  # pylint: disable=unused-argument
+        painter = QtGui.QPainter(self)
+        rect = QtCore.QRectF(self.rect())
+
+        # Frame, following SS_TEXTBOX_READ_ONLY and SS_TEXTBOX_ERRORS
+        if self._error:
+            border_color = QtGui.QColor("red")
+            border_width = 2
+            background = _THEME.COLOR_WARNING_YELLOW
+        else:
+            border_color = (
+                _to_QColor(_THEME.COLOR_HOVER_BORDER)
+                if self.underMouse()
+                else QtGui.QColor("gray")
+            )
+            border_width = 1
+            background = _THEME.COLOR_READ_ONLY
+
+        painter.fillRect(rect, _to_QColor(background))
+        half = border_width / 2
+        painter.setPen(QtGui.QPen(border_color, border_width))
+        painter.drawRect(rect.adjusted(half, half, -half, -half))
+
+        if not self._text:
+            return
+
+        # Text
+        font = self.font()
+        text_rect = rect.adjusted(4, 2, -4, -2)
+        qfm = QtGui.QFontMetrics(font)
+        y = text_rect.top() + (text_rect.height() - qfm.height()) / 2
+
+        if not _draw_glyphs(
+            painter,
+            text_rect,
+            y,
+            self._text,
+            font,
+            self._alignment,
+            self.devicePixelRatioF(),
+        ):
+            if self._static_text is None:
+                self._static_text = QtGui.QStaticText(self._text)
+                self._static_text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+                self._static_text.prepare(QtGui.QTransform(), font)
+            width = self._static_text.size().width()
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor("black"))
+            painter.drawStaticText(
+                QtCore.QPointF(
+                    _aligned_x(text_rect, width, self._alignment), y
+                ),
+                self._static_text,
+            )
+
+
+# ------------------------------------------------------------------------------
+#   Log console
+# ------------------------------------------------------------------------------
+
+
+class LogConsole(QtWid.QPlainTextEdit):
+    """Read-only log console that copes with high message rates.
+
+    Messages can be appended from any thread. They are kept in a ring buffer
+    and get added to the console in batches on a timer in the GUI thread,
+    instead of one by one. The console holds at most `max_lines` lines, older
+    lines are discarded. It auto-scrolls only when the view was already
+    scrolled to the bottom, so that scrolling back through the log is not
+    interrupted.
+
+    Severities 'warning' and 'error' are highlighted with
+    `COLOR_WARNING_YELLOW` and `COLOR_ERROR_RED`, respectively.
+
+    Args:
+        max_lines (int): Maximum number of lines kept.
+        flush_interval_ms (int): Interval at which pending messages get added.
+        role (str): Stylesheet variant, either "textbox_read_only" or
+            "textbox_errors".
+    """
+
+    SEVERITIES = ("info", "warning", "error")
+
+    def __init__(
+        self,
+        max_lines: int = 10000,
+        flush_interval_ms: int = 100,
+        role: str = "textbox_read_only",
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+
+        self._store = deque(maxlen=max_lines)  # (severity, message)
+        self._pending = deque(maxlen=max_lines)
+        self._has_text = False
+
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+        self.setLineWrapMode(QtWid.QPlainTextEdit.LineWrapMode.NoWrap)
+        _style_control(self, role)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(flush_interval_ms)
+
+    def append(self, message: str, severity: str = "info"):
+        """Queue a message to be added at the next flush. Can be called from any
+        thread. Multi-line messages are allowed.
+        """
+        entry = (severity, str(message))
+        self._store.append(entry)
+        self._pending.append(entry)
+
+    def info(self, message: str):
+        self.append(message, "info")
+
+    def warning(self, message: str):
+        self.append(message, "warning")
+
+    def error(self, message: str):
+        self.append(message, "error")
+
+    def messages(self) -> List[tuple]:
+        """Return the last `max_lines` messages as `(severity, message)`."""
+        return list(self._store)
+
+    def clear(self):
+        self._store.clear()
+        self._pending.clear()
+        self._has_text = False
+        super().clear()
+
+    def _char_formats(self) -> dict:
+        formats = {
+            severity: QtGui.QTextCharFormat() for severity in self.SEVERITIES
+        }
+        formats["warning"].setBackground(
+            _to_QColor(_THEME.COLOR_WARNING_YELLOW)
+        )
+        formats["error"].setForeground(_to_QColor(_THEME.COLOR_ERROR_RED))
+        formats["error"].setFontWeight(QtGui.QFont.Weight.Bold)
+        return formats
+
+    @QtCore.Slot()
+    def flush(self):
+        """Add all pending messages to the console in one edit block. Called
+        periodically by the internal timer.
+        """
+        if not self._pending:
+            return
+
+        batch = []
+        try:
+            while True:
+                batch.append(self._pending.popleft())
+        except IndexError:
+            pass
+
+        # Only the last `max_lines` messages would survive anyway
+        batch = batch[-self.maximumBlockCount() :]
+
+        # Merge consecutive messages of the same severity into runs
+        runs = []
+        for severity, message in batch:
+            if runs and runs[-1][0] == severity:
+                runs[-1][1].append(message)
+            else:
+                runs.append((severity, [message]))
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        formats = self._char_formats()
+
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for severity, messages in runs:
+            if self._has_text:
+                cursor.insertBlock()
+            cursor.insertText(
+                "\n".join(messages),
+                formats.get(severity, formats["info"]),
+            )
+            self._has_text = True
+        cursor.endEditBlock()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+
+# ------------------------------------------------------------------------------
+#   Channel grid
+# ------------------------------------------------------------------------------
+
+# Looks of the relay and toggle buttons as painted by `ChannelDelegate`, by
+# their role: (unchecked, checked), each as (background palette entry, border
+# color, bold text). Derived from the corresponding stylesheets.
+_PAINTED_BUTTONS = {
+    "relay_button": (
+        ("COLOR_LED_RED", "black", False),
+        ("COLOR_LED_GREEN", "black", False),
+    ),
+    "toggle_button": (
+        ("COLOR_BG", "dimgray", False),
+        ("COLOR_LED_GREEN", "mediumspringgreen", False),
+    ),
+    "toggle_button_2": (
+        ("COLOR_BG", "dimgray", False),
+        ("COLOR_WARNING_YELLOW", "red", True),
+    ),
+    "toggle_button_3": (
+        ("COLOR_WARNING_YELLOW", "firebrick", True),
+        ("COLOR_LED_GREEN", "mediumspringgreen", False),
+    ),
+}
+
+
+class ChannelColumn:
+    """Column of a `ChannelTableModel`.
+
+    Args:
+        title (str): Column header.
+        kind (str): How the cells look. One of "label", "readout", the LED
+            roles "led_indicator", "led_indicator_rect", "error_led",
+            "tiny_led", "tiny_error_led", or the button roles "relay_button",
+            "toggle_button", "toggle_button_2", "toggle_button_3".
+        fmt (str): Format template for the cell values of a "label" or
+            "readout" column, e.g. "{:.3f}".
+        texts (tuple): Labels (unchecked, checked) of a button column.
+            Defaults to ("0", "1") for relay buttons and ("Off", "On") for
+            toggle buttons.
+    """
+
+    KINDS = ("label", "readout", *_PAINTED_LEDS, *_PAINTED_BUTTONS)
+
+    def __init__(
+        self,
+        title: str,
+        kind: str = "label",
+        fmt: str = "{}",
+        texts: Optional[tuple] = None,
+    ):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown column kind '{kind}'.")
+        if texts is None:
+            texts = ("0", "1") if kind == "relay_button" else ("Off", "On")
+
+        self.title = title
+        self.kind = kind
+        self.format = fmt.format
+        self.texts = texts
+
+
+class ChannelTableModel(QtCore.QAbstractTableModel):
+    """Table model holding one row per channel and one `ChannelColumn` per
+    quantity, for display in a `ChannelView`. Memory use is a plain list of
+    values per column, instead of a widget per cell.
+
+    Use `set_column()` and `set_cells()` to update values. Only the values that
+    actually changed are signalled, merged into contiguous `dataChanged` ranges.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[ChannelColumn],
+        N_rows: int,
+        row_titles: Optional[Sequence[str]] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._values = [[None] * N_rows for _ in self._columns]
+        self._row_titles = list(row_titles) if row_titles else None
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._values[0])
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def column(self, col: int) -> ChannelColumn:
+        return self._columns[col]
+
+    def value(self, row: int, col: int):
+        return self._values[col][row]
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._values[index.column()][index.row()]
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return value
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            column = self._columns[index.column()]
+            if value is None:
+                return ""
+            if column.kind in ("label", "readout"):
+                return column.format(value)
+            if column.kind in _PAINTED_BUTTONS:
+                return column.texts[bool(value)]
+        return None
+
+    def headerData(
+        self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole
+    ):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self._columns[section].title
+        if self._row_titles:
+            return self._row_titles[section]
+        return str(section)
+
+    def set_column(self, col: int, values: Sequence) -> int:
+        """Replace all values of column `col`.
+
+        Returns:
+            The number of cells that changed.
+        """
+        old_values = self._values[col]
+        if len(values) != len(old_values):
+            raise ValueError(
+                f"Expected {len(old_values)} values, got {len(values)}."
+            )
+        if hasattr(values, "tolist"):  # NumPy array
+            values = values.tolist()
+
+        changed_rows = [
+            row
+            for row, (old, new) in enumerate(zip(old_values, values))
+            if old != new
+        ]
+        for row in changed_rows:
+            old_values[row] = values[row]
+        self._emit_ranges(col, changed_rows)
+        return len(changed_rows)
+
+    def set_cells(self, updates: dict) -> int:
+        """Set the values of a dict `{(row, col): value}`.
+
+        Returns:
+            The number of cells that changed.
+        """
+        changed = {}
+        for (row, col), value in updates.items():
+            if self._values[col][row] != value:
+                self._values[col][row] = value
+                changed.setdefault(col, []).append(row)
+
+        for col, rows in changed.items():
+            self._emit_ranges(col, sorted(rows))
+        return sum(len(rows) for rows in changed.values())
+
+    def _emit_ranges(self, col: int, rows: List[int]):
+        """Emit `dataChanged` for each contiguous run of the sorted `rows`."""
+        if not rows:
+            return
+        first = last = rows[0]
+        for row in rows[1:]:
+            if row != last + 1:
+                self.dataChanged.emit(
+                    self.index(first, col), self.index(last, col)
+                )
+                first = row
+            last = row
+        self.dataChanged.emit(self.index(first, col), self.index(last, col))
+
+
+class ChannelDelegate(QtWid.QStyledItemDelegate):
+    """Paints the cells of a `ChannelTableModel` with the looks of the LEDs,
+    relay and toggle buttons and read-only textboxes of this module, using
+    cached pixmaps and glyphs.
+    """
+
+    def paint(self, painter, option, index):
+        column = index.model().column(index.column())
+        if column.kind == "label":
+            super().paint(painter, option, index)
+            return
+
+        value = index.data(QtCore.Qt.ItemDataRole.UserRole)
+        rect = QtCore.QRectF(option.rect).adjusted(2, 2, -2, -2)
+        dpr = painter.device().devicePixelRatioF()
+
+        if column.kind == "readout":
+            painter.fillRect(rect, _to_QColor(_THEME.COLOR_READ_ONLY))
+            painter.setPen(QtGui.QColor("gray"))
+            painter.drawRect(rect.adjusted(0.5, 0.5, -0.5, -0.5))
+            text = index.data()
+            if text:
+                text_rect = rect.adjusted(4, 0, -4, 0)
+                y = (
+                    text_rect.top()
+                    + (text_rect.height() - option.fontMetrics.height()) / 2
+                )
+                alignment = QtCore.Qt.AlignmentFlag.AlignRight
+                if not _draw_glyphs(
+                    painter, text_rect, y, text, option.font, alignment, dpr
+                ):
+                    painter.setPen(QtGui.QColor("black"))
+                    painter.drawText(
+                        text_rect,
+                        alignment | QtCore.Qt.AlignmentFlag.AlignVCenter,
+                        text,
+                    )
+            return
+
+        if value is None:
+            return
+
+        if column.kind in _PAINTED_LEDS:
+            LED_args = _PAINTED_LEDS[column.kind]
+            size = LED_args["size"]
+            width = max(size, LED_args.get("min_width", 0))
+            color = getattr(
+                _THEME, LED_args["color_on" if value else "color_off"]
+            )
+            pixmap = _LED_pixmap(LED_args["shape"], width, size, color, dpr)
+            bold = LED_args.get("bold_on", False) and bool(value)
+            radius = 0
+        else:
+            color, border_color, bold = _PAINTED_BUTTONS[column.kind][
+                bool(value)
+            ]
+            if column.kind == "relay_button":
+                width = size = 30
+                radius = 0
+            else:
+                width = round(rect.width())
+                size = min(30, round(rect.height()))
+                radius = 5
+            pixmap = _LED_pixmap(
+                "rect",
+                width,
+                size,
+                getattr(_THEME, color),
+                dpr,
+                radius=radius,
+                border_color=border_color,
+                border_width=1 if column.kind == "relay_button" else 2,
+            )
+
+        x = rect.left() + (rect.width() - width) / 2
+        y = rect.top() + (rect.height() - size) / 2
+        painter.drawPixmap(QtCore.QPointF(x, y), pixmap)
+
+        text = index.data()
+        if text:
+            font = QtGui.QFont(option.font)
+            font.setBold(bold)
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor("black"))
+            painter.drawText(
+                QtCore.QRectF(x, y, width, size),
+                QtCore.Qt.AlignmentFlag.AlignCenter,
+                text,
+            )
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        size = _channel_cell_size(index.model().column(index.column()).kind)
+        return size if size is not None else super().sizeHint(option, index)
+
+
+def _channel_cell_size(kind: str) -> Optional[QtCore.QSize]:
+    """Return the fixed cell size of a column of `kind`, or None when the cell
+    size depends on its contents.
+    """
+    if kind in _PAINTED_LEDS:
+        LED_args = _PAINTED_LEDS[kind]
+        width = max(LED_args["size"], LED_args.get("min_width", 0))
+        return QtCore.QSize(width + 4, LED_args["size"] + 4)
+    if kind == "relay_button":
+        return QtCore.QSize(34, 34)
+    if kind in _PAINTED_BUTTONS:
+        return QtCore.QSize(84, 34)
+    return None
+
+
+class ChannelView(QtWid.QTableView):
+    """Table view of a `ChannelTableModel`, painted by a `ChannelDelegate`.
+    Scales to thousands of channels: Only the visible cells get painted, and
+    no widget is created per cell.
+
+    Clicking an enabled relay or toggle button cell does not change its value.
+    Instead `toggleRequested(row, col, requested_state)` is emitted, after which
+    the program should commit the new value using `set_column()` or
+    `set_cells()` of the model, e.g. after the device operation succeeded.
+    """
+
+    toggleRequested = QtCore.Signal(int, int, bool)
+
+    def __init__(self, model: ChannelTableModel, parent=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.setModel(model)
+        self.setItemDelegate(ChannelDelegate(self))
+        self.setSelectionMode(QtWid.QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QtWid.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+
+        # Fixed row heights and column widths spare the view from measuring
+        # the contents of every row
+        row_height = self.fontMetrics().height() + 8
+        header = self.horizontalHeader()
+        for col in range(model.columnCount()):
+            kind = model.column(col).kind
+            size = _channel_cell_size(kind)
+            if size is not None:
+                row_height = max(row_height, size.height())
+                header.resizeSection(col, size.width())
+            elif kind == "readout":
+                header.resizeSection(col, e8(8, self.font()))
+
+        header = self.verticalHeader()
+        header.setSectionResizeMode(QtWid.QHeaderView.ResizeMode.Fixed)
+        header.setDefaultSectionSize(row_height)
+
+        self.clicked.connect(self._on_clicked)
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _on_clicked(self, index):
+        model = self.model()
+        if model.column(index.column()).kind in _PAINTED_BUTTONS:
+            value = model.value(index.row(), index.column())
+            self.toggleRequested.emit(
+                index.row(), index.column(), not bool(value)
+            )
+
+
+# ------------------------------------------------------------------------------
+#   Scene items
+# ------------------------------------------------------------------------------
+
+# Cache of the outlines of scene items, shared by all instances and used for
+# hit testing. Key: (shape, width, height, radius)
+_ITEM_PATH_CACHE = {}
+
+
+def _item_path(
+    shape: str, width: float, height: float, radius: float = 0
+) -> QtGui.QPainterPath:
+    key = (shape, width, height, radius)
+    path = _ITEM_PATH_CACHE.get(key)
+    if path is None:
+        path = QtGui.QPainterPath()
+        rect = QtCore.QRectF(0, 0, width, height)
+        if shape == "round":
+            path.addEllipse(rect)
+        elif radius:
+            path.addRoundedRect(rect, radius, radius)
+        else:
+            path.addRect(rect)
+        _ITEM_PATH_CACHE[key] = path
+    return path
+
+
+# Above this device scale, scene items are drawn directly instead of from
+# ever larger pixmaps
+_ITEM_MAX_PIXMAP_SCALE = 4
+
+
+class _ControlItem(QtWid.QGraphicsObject):
+    """Base of the scene items `LEDItem` and `ButtonItem`. Paints itself using
+    the pixmaps shared with the painted LEDs, rendered at the resolution of
+    the device, also when the scene is zoomed. When zoomed in far, it draws
+    its outline directly instead. Uses item-level caching in device
+    coordinates.
+
+    Args:
+        looks (tuple): The look of the unchecked and of the checked state, each
+            as (color key of the theme, border color, border width, bold).
+    """
+
+    toggled = QtCore.Signal(bool)
+
+    def __init__(
+        self,
+        looks: tuple,
+        text: str,
+        checked: bool,
+        width: Optional[int],
+        parent,
+        shape: str = "rect",
+        height: int = 30,
+        min_width: int = 30,
+        radius: float = 0,
+    ):
+        super().__init__(parent)
+
+        self._looks = looks
+        self._text = text
+        self._checked = bool(checked)
+        self._fixed_width = width
+        self._shape = shape
+        self._height = height
+        self._min_width = min_width
+        self._radius = radius
+        self._rect = QtCore.QRectF()
+        self._resize()
+
+        self.setCacheMode(QtWid.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def _resize(self):
+        """Fit the width to the text, unless the width is fixed."""
+        width = self._fixed_width
+        if width is None:
+            text_width = QtGui.QFontMetrics(
+                QtGui.QGuiApplication.font()
+            ).horizontalAdvance(self._text)
+            width = max(self._min_width, text_width + 12)
+        rect = QtCore.QRectF(0, 0, width, self._height)
+        if rect != self._rect:
+            self.prepareGeometryChange()
+            self._rect = rect
+
+    def _look(self) -> tuple:
+        """Return (color, border color, border width, bold) of the current
+        state.
+        """
+        color, border_color, border_width, bold = self._looks[self._checked]
+        return getattr(_THEME, color), border_color, border_width, bold
+
+    def isChecked(self) -> bool:
+        return self._checked
+
+    def setChecked(self, checked: bool):
+        checked = bool(checked)
+        if checked == self._checked:
+            return
+        self._checked = checked
+        self.update()
+        self.toggled.emit(checked)
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str):
+        if text == self._text:
+            return
+        self._text = text
+        self._resize()
+        self.update()
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._rect
+
+    def shape(self) -> QtGui.QPainterPath:
+        return _item_path(
+            self._shape, self._rect.width(), self._height, self._radius
+        )
+
+    def paint(
+        self, painter, option, widget=None
+    ):  # pylint: disable=unused-argument
+        color, border_color, border_width, bold = self._look()
+
+        # Render at the scale of the device, in steps to limit the number of
+        # cached pixmaps
+        scale = abs(painter.worldTransform().determinant()) ** 0.5
+        dpr = painter.device().devicePixelRatioF() * scale
+        dpr = max(0.25, round(dpr * 4) / 4)
+
+        if dpr > _ITEM_MAX_PIXMAP_SCALE:
+            painter.save()
+            _draw_LED_body(
+                painter,
+                self._rect,
+                self._shape,
+                color,
+                self._radius,
+                border_color,
+                border_width,
+            )
+            painter.restore()
+        else:
+            width = round(self._rect.width())
+            painter.drawPixmap(
+                self._rect,
+                _LED_pixmap(
+                    self._shape,
+                    width,
+                    self._height,
+                    color,
+                    dpr,
+                    radius=self._radius,
+                    border_color=border_color,
+                    border_width=border_width,
+                ),
+                QtCore.QRectF(
+                    0, 0, round(width * dpr), round(self._height * dpr)
+                ),
+            )
+
+        if self._text:
+            font = QtGui.QFont(
+                self.scene().font()
+                if self.scene() is not None
+                else QtGui.QGuiApplication.font()
+            )
+            font.setBold(bold)
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor("black"))
+            painter.drawText(
+                self._rect, QtCore.Qt.AlignmentFlag.AlignCenter, self._text
+            )
+
+
+class LEDItem(_ControlItem):
+    """Lightweight `QGraphicsItem` counterpart of the LEDs of this module, for
+    scenes with many status points. Far cheaper than embedding LED widgets
+    with a `QGraphicsProxyWidget`.
+
+    Args:
+        role (str): The LED to mimic, one of "led_indicator",
+            "led_indicator_rect", "error_led", "tiny_led" and
+            "tiny_error_led".
+        text (str): Label drawn centered on top of the LED.
+        checked (bool): Initial state.
+        width (int): Fixed width of a rectangular LED. Default: Fit the text.
+    """
+
+    def __init__(
+        self,
+        role: str = "led_indicator",
+        text: str = "",
+        checked: bool = False,
+        width: Optional[int] = None,
+        parent=None,
+    ):
+        if role not in _PAINTED_LEDS:
+            raise ValueError(f"Unknown LED role '{role}'.")
+        LED_args = _PAINTED_LEDS[role]
+        size = LED_args["size"]
+        if LED_args["shape"] == "round":
+            width = size
+        looks = (
+            (LED_args["color_off"], "black", 1, False),
+            (LED_args["color_on"], "black", 1, LED_args.get("bold_on", False)),
+        )
+        super().__init__(
+            looks,
+            text,
+            checked,
+            width,
+            parent,
+            shape=LED_args["shape"],
+            height=size,
+            min_width=max(size, LED_args.get("min_width", 0)),
+        )
+
+
+class ButtonItem(_ControlItem):
+    """Lightweight `QGraphicsItem` counterpart of the relay and toggle buttons
+    of this module. Clicking it flips its checked state.
+
+    Args:
+        role (str): The button to mimic, one of "relay_button",
+            "toggle_button", "toggle_button_2" and "toggle_button_3".
+        text (str): Label of the button.
+        checked (bool): Initial state.
+        width (int): Fixed width of a toggle button. Default: Fit the text.
+
+    Signals:
+        clicked(bool): Emitted when clicked, with the new checked state.
+        toggled(bool): Emitted whenever the checked state changes.
+    """
+
+    clicked = QtCore.Signal(bool)
+
+    def __init__(
+        self,
+        role: str = "relay_button",
+        text: str = "",
+        checked: bool = False,
+        width: Optional[int] = None,
+        parent=None,
+    ):
+        if role not in _PAINTED_BUTTONS:
+            raise ValueError(f"Unknown button role '{role}'.")
+        relay = role == "relay_button"
+        border_width = 1 if relay else 2
+        looks = tuple(
+            (color, border_color, border_width, bold)
+            for color, border_color, bold in _PAINTED_BUTTONS[role]
+        )
+        super().__init__(
+            looks,
+            text,
+            checked,
+            30 if relay else width,
+            parent,
+            radius=0 if relay else 5,
+        )
+
+        self.setCursor(_pointing_hand_cursor())
+        self.setAcceptedMouseButtons(QtCore.Qt.MouseButton.LeftButton)
+
+    def mousePressEvent(self, event):
+        # Accept, to receive the release event
+        event.accept()
+
+    def mouseReleaseEvent(self, event):
+        if self.shape().contains(event.pos()):
+            self.setChecked(not self._checked)
+            self.clicked.emit(self._checked)
+
+
+# ------------------------------------------------------------------------------
+#   Streaming chart
+# ------------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _graph_pen(color: tuple, width: float) -> QtGui.QPen:
+    """Return a cached cosmetic pen of the `COLOR_PEN_*` color `color`."""
+    pen = QtGui.QPen(QtGui.QColor(*color))
+    pen.setWidthF(width)
+    pen.setCosmetic(True)
+    return pen
+
+
+class _RingBuffer:
+    """Fixed-capacity ring buffer of floats. Appending never reallocates."""
+
+    def __init__(self, capacity: int):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self._data = np.zeros(capacity)
+        self._ordered = np.zeros(capacity)  # Scratch space of `ordered()`
+        self._capacity = capacity
+        self._idx = 0  # Position of the next write
+        self.count = 0
+
+    def extend(self, values):
+        values = values[-self._capacity :]
+        N = len(values)
+        end = self._idx + N
+        if end <= self._capacity:
+            self._data[self._idx : end] = values
+        else:
+            split = self._capacity - self._idx
+            self._data[self._idx :] = values[:split]
+            self._data[: N - split] = values[split:]
+        self._idx = end % self._capacity
+        self.count = min(self._capacity, self.count + N)
+
+    def append(self, value: float):
+        self._data[self._idx] = value
+        self._idx = (self._idx + 1) % self._capacity
+        if self.count < self._capacity:
+            self.count += 1
+
+    def ordered(self):
+        """Return the contents from oldest to newest. The returned array is
+        reused by the next call.
+        """
+        if self.count < self._capacity:
+            return self._data[: self.count]
+        split = self._capacity - self._idx
+        self._ordered[:split] = self._data[self._idx :]
+        self._ordered[split:] = self._data[: self._idx]
+        return self._ordered
+
+    def clear(self):
+        self._idx = 0
+        self.count = 0
+
+
+def _minmax_decimate(y, N_bins: int) -> tuple:
+    """Reduce `y` to the minimum and maximum of each of `N_bins` bins, which
+    preserves the envelope of the signal when drawn one bin per pixel.
+
+    Returns:
+        (x, y) where `x` holds the sample indices into the original `y`.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    N = len(y)
+    if N <= 2 * N_bins:
+        return np.arange(N, dtype=float), y
+
+    bin_size = N // N_bins
+    start = N - bin_size * N_bins  # Drop the oldest few samples
+    bins = y[start:].reshape(N_bins, bin_size)
+    y_dec = np.empty(2 * N_bins)
+    y_dec[0::2] = bins.min(axis=1)
+    y_dec[1::2] = bins.max(axis=1)
+    x_dec = np.repeat(start + np.arange(N_bins) * bin_size, 2).astype(float)
+    x_dec[1::2] += bin_size - 1
+    return x_dec, y_dec
+
+
+def _fill_polygon(polygon: QtGui.QPolygonF, x, y) -> QtGui.QPolygonF:
+    """Fill `polygon` with the points (x, y), resizing it only when the number
+    of points changed. Writes directly into the memory of the polygon when
+    the Qt lib allows, which avoids creating a `QPointF` per point.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    N = len(x)
+    if polygon.size() != N:
+        if QT_LIB in (PYQT5, PYQT6):
+            polygon = QtGui.QPolygonF()
+            polygon.fill(QtCore.QPointF(), N)
+        else:
+            polygon.resize(N)
+    if N == 0:
+        return polygon
+
+    if QT_LIB in (PYQT5, PYQT6):
+        buffer = polygon.data()
+        buffer.setsize(2 * N * 8)
+    else:
+        # pylint: disable=import-outside-toplevel
+        if QT_LIB == PYSIDE2:
+            import shiboken2 as shiboken  # type: ignore
+        else:
+            import shiboken6 as shiboken  # type: ignore
+        buffer = shiboken.VoidPtr(polygon.data(), 2 * N * 8, True)
+
+    points = np.frombuffer(buffer, dtype=np.float64).reshape(N, 2)
+    points[:, 0] = x
+    points[:, 1] = y
+    return polygon
+
+
+class StreamingChart(QtWid.QWidget):
+    """Chart of live, uniformly sampled traces, scrolling from right to left.
+
+    Each trace has a preallocated ring buffer of `capacity` samples, so
+    appending never reallocates. At most `fps` times per second, and only when
+    new data arrived, the traces are reduced by min/max decimation to two
+    points per pixel column and redrawn using cached pens from `COLOR_PENS`
+    on the `COLOR_GRAPH_BG` background.
+
+    The native backend draws only the traces. Pass `backend="pyqtgraph"` to
+    draw into a `pyqtgraph.PlotWidget` instead, with axes in seconds.
+    Requires NumPy, and PyQtGraph for its backend.
+
+    Samples can be appended from any thread.
+
+    Args:
+        N_traces (int): Number of traces.
+        capacity (int): Number of samples kept per trace.
+        sample_rate (float): Sample rate in Hz, used for the time axis.
+        y_range (tuple): Fixed (min, max) of the y-axis. Default: Autoscale.
+        fps (float): Maximum redraw rate.
+        pen_width (float): Width of the trace pens in pixels.
+        backend (str): Either "native" or "pyqtgraph".
+    """
+
+    def __init__(
+        self,
+        N_traces: int = 1,
+        capacity: int = 10000,
+        sample_rate: float = 1.0,
+        y_range: Optional[tuple] = None,
+        fps: float = 30,
+        pen_width: float = 1,
+        backend: str = "native",
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self._np = np
+        self._lock = threading.Lock()
+        self._buffers = [_RingBuffer(capacity) for _ in range(N_traces)]
+        self._capacity = capacity
+        self._sample_rate = sample_rate
+        self._y_range = y_range
+        self._pens = [
+            _graph_pen(tuple(COLOR_PENS[i % len(COLOR_PENS)]), pen_width)
+            for i in range(N_traces)
+        ]
+        self._polygons = [QtGui.QPolygonF() for _ in range(N_traces)]
+        self._dirty = False
+        self._plot = None
+        self._curves = None
+
+        if backend == "pyqtgraph":
+            import pyqtgraph as pg  # pylint: disable=import-outside-toplevel
+
+            self._plot = pg.PlotWidget(
+                background=QtGui.QColor(*_COLOR_GRAPH["COLOR_GRAPH_BG"])
+            )
+            self._plot.getAxis("bottom").setLabel("time", units="s")
+            if y_range is not None:
+                self._plot.setYRange(*y_range, padding=0)
+            self._plot.setXRange(-(capacity - 1) / sample_rate, 0, padding=0)
+            self._curves = [self._plot.plot(pen=pen) for pen in self._pens]
+            layout = QtWid.QVBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(self._plot)
+        elif backend != "native":
+            raise ValueError(f"Unknown backend '{backend}'.")
+        else:
+            self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._refresh)
+        self._timer.start(max(1, round(1000 / fps)))
+
+    def append(self, trace: int, values):
+        """Append a sample or an array of samples to trace number `trace`."""
+        values = self._np.atleast_1d(self._np.asarray(values, dtype=float))
+        with self._lock:
+            self._buffers[trace].extend(values)
+            self._dirty = True
+
+    def append_all(self, samples):
+        """Append a 2D array of samples with shape (N_samples, N_traces) to all
+        traces at once.
+        """
+        samples = self._np.asarray(samples, dtype=float).reshape(
+            -1, len(self._buffers)
+        )
+        with self._lock:
+            for trace, buffer in enumerate(self._buffers):
+                buffer.extend(samples[:, trace])
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            for buffer in self._buffers:
+                buffer.clear()
+            self._dirty = True
+
+    def _decimated(self, N_bins: int) -> list:
+        """Return the decimated (x, y) per trace, with x in samples relative to
+        the newest sample.
+        """
+        traces = []
+        with self._lock:
+            self._dirty = False
+            for buffer in self._buffers:
+                x, y = _minmax_decimate(buffer.ordered(), N_bins)
+                traces.append((x - (buffer.count - 1), y.copy()))
+        return traces
+
+    @QtCore.Slot()
+    def _refresh(self):
+        if not self._dirty or not self.isVisible():
+            return
+        if self._curves is None:
+            self.update()
+            return
+
+        N_bins = max(1, self._plot.getPlotItem().vb.width())
+        for curve, (x, y) in zip(self._curves, self._decimated(round(N_bins))):
+            curve.setData(x / self._sample_rate, y)
+
+    def paintEvent(self, event):  # pylint: disable=unused-argument
+        if self._curves is not None:
+            return
+
+        np = self._np
+        painter = QtGui.QPainter(self)
+        painter.fillRect(
+            self.rect(), QtGui.QColor(*_COLOR_GRAPH["COLOR_GRAPH_BG"])
+        )
+
+        width = self.width()
+        height = self.height()
+        traces = self._decimated(width)
+
+        if self._y_range is not None:
+            y_min, y_max = self._y_range
+        else:
+            finite = [y[np.isfinite(y)] for _, y in traces if len(y)]
+            finite = [y for y in finite if len(y)]
+            if not finite:
+                return
+            y_min = min(y.min() for y in finite)
+            y_max = max(y.max() for y in finite)
+        if y_max == y_min:
+            y_min -= 0.5
+            y_max += 0.5
+
+        x_scale = (width - 1) / max(1, self._capacity - 1)
+        y_scale = (height - 1) / (y_max - y_min)
+        for idx, (x, y) in enumerate(traces):
+            if len(x) < 2:
+                continue
+            self._polygons[idx] = _fill_polygon(
+                self._polygons[idx],
+                (width - 1) + x * x_scale,
+                (height - 1) - (y - y_min) * y_scale,
+            )
+            painter.setPen(self._pens[idx])
+            painter.drawPolyline(self._polygons[idx])
+
+
+class Sparkline(QtWid.QWidget):
+    """Compact trend of the most recent values of a single channel, meant to
+    be shown next to an LED or a readout.
+
+    The values are kept in a preallocated ring buffer of `capacity` values.
+    The polyline of the trend is only recalculated when values were added or
+    the widget was resized, and is drawn with a single `drawPolyline()` in one
+    of the `COLOR_PEN_*` colors on the `COLOR_GRAPH_BG` background. Requires
+    NumPy.
+
+    Args:
+        capacity (int): Number of values shown.
+        y_range (tuple): Fixed (min, max) of the y-axis. Default: Autoscale to
+            the values shown.
+        color (list): One of the `COLOR_PEN_*` colors.
+        N_e8 (int): Width of the widget, expressed as the number of '8's that
+            would fit in its font. See `e8()`.
+        pen_width (float): Width of the pen in pixels.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 60,
+        y_range: Optional[tuple] = None,
+        color: list = COLOR_PEN_TURQUOISE,
+        N_e8: int = 6,
+        pen_width: float = 1,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self._np = np
+        self._buffer = _RingBuffer(capacity)
+        self._capacity = capacity
+        self._y_range = y_range
+        self._pen = _graph_pen(tuple(color), pen_width)
+        self._N_e8 = N_e8
+        self._polygon = QtGui.QPolygonF()
+        self._x = None  # Pixel x-coordinates of all values, set per width
+        self._dirty = False
+
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setSizePolicy(
+            QtWid.QSizePolicy.Policy.Fixed, QtWid.QSizePolicy.Policy.Fixed
+        )
+
+    def append(self, value: float):
+        self._buffer.append(value)
+        self._dirty = True
+        self.update()
+
+    def extend(self, values):
+        values = self._np.asarray(values, dtype=float).ravel()
+        if len(values):
+            self._buffer.extend(values)
+            self._dirty = True
+            self.update()
+
+    def values(self):
+        """Return a copy of the values shown, from oldest to newest."""
+        return self._buffer.ordered().copy()
+
+    def clear(self):
+        self._buffer.clear()
+        self._dirty = True
+        self.update()
+
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(
+            e8(self._N_e8, self.font()), self.fontMetrics().height() + 6
+        )
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return self.sizeHint()
+
+    def resizeEvent(self, event):
+        self._x = None
+        self._dirty = True
+        super().resizeEvent(event)
+
+    def _update_polygon(self):
+        np = self._np
+        self._dirty = False
+        y = self._buffer.ordered()
+        N = len(y)
+        if N < 2:
+            self._polygon = QtGui.QPolygonF()
+            return
+
+        if self._y_range is not None:
+            y_min, y_max = self._y_range
+        else:
+            y_min = y.min()
+            y_max = y.max()
+            if not np.isfinite(y_min + y_max):
+                finite = y[np.isfinite(y)]
+                if not len(finite):
+                    self._polygon = QtGui.QPolygonF()
+                    return
+                y_min = finite.min()
+                y_max = finite.max()
+        if y_max == y_min:
+            y_min -= 0.5
+            y_max += 0.5
+
+        # Keep the line clear of the edges
+        margin = 2
+        width = self.width()
+        height = self.height()
+        if self._x is None:
+            # The newest value lines up with the right edge
+            self._x = np.linspace(margin, width - 1 - margin, self._capacity)
+        y_scale = (height - 1 - 2 * margin) / (y_max - y_min)
+        self._polygon = _fill_polygon(
+            self._polygon,
+            self._x[-N:],
+            (height - 1 - margin) - (y - y_min) * y_scale,
+        )
+
+    def paintEvent(self, event):  # pylint: disable=unused-argument
+        if self._dirty:
+            self._update_polygon()
+
+        painter = QtGui.QPainter(self)
+        painter.fillRect(
+            self.rect(), QtGui.QColor(*_COLOR_GRAPH["COLOR_GRAPH_BG"])
+        )
+        if self._polygon.size() > 1:
+            painter.setPen(self._pen)
+            painter.drawPolyline(self._polygon)
+
+
+# ------------------------------------------------------------------------------
+#   Themes
+# ------------------------------------------------------------------------------
+
+# Palette entries of a `Theme`, with their default values
+DEFAULT_PALETTE = {
+    "COLOR_BG": COLOR_BG,
+    "COLOR_LED_GREEN": COLOR_LED_GREEN,
+    "COLOR_LED_RED": COLOR_LED_RED,
+    "COLOR_LED_NEUTRAL": COLOR_LED_NEUTRAL,
+    "COLOR_GROUP_BG": COLOR_GROUP_BG,
+    "COLOR_READ_ONLY": COLOR_READ_ONLY,
+    "COLOR_TAB_ACTIVE": COLOR_TAB_ACTIVE,
+    "COLOR_TAB": COLOR_TAB,
+    "COLOR_HOVER": COLOR_HOVER,
+    "COLOR_HOVER_BORDER": COLOR_HOVER_BORDER,
+    "COLOR_ERROR_RED": COLOR_ERROR_RED,
+    "COLOR_WARNING_YELLOW": COLOR_WARNING_YELLOW,
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_stylesheets(palette: tuple) -> MappingProxyType:
+    """Substitute the `palette` items into all `SS_TEMPLATES`. The result is
+    cached per palette.
+    """
+    mapping = dict(
+        palette,
+        DFLT_TOGGLE_BTN_PADDING=DFLT_TOGGLE_BTN_PADDING,
+        DFLT_TOGGLE_BTN_BORDER_WIDTH=DFLT_TOGGLE_BTN_BORDER_WIDTH,
+        DFLT_TOGGLE_BTN_BORDER_RADIUS=DFLT_TOGGLE_BTN_BORDER_RADIUS,
+        GROUP_MARGIN_TOP=GROUP_MARGIN_TOP,
+    )
+    return MappingProxyType(
+        {
+            role: re.sub(r"\$(\w+)", lambda m: mapping[m.group(1)], template)
+            for role, template in SS_TEMPLATES.items()
+        }
+    )
+
+
+class Theme:
+    """Color palette from which all stylesheets of this module are compiled.
+    Palette entries that are not specified take their value from
+    `DEFAULT_PALETTE`. Themes are immutable and compare equal when their
+    palettes are equal.
+
+    Usage:
+        dark = Theme(
+            COLOR_BG="rgb(40, 40, 40)", COLOR_GROUP_BG="rgb(60, 60, 60)"
+        )
+        apply_theme(dark)
+    """
+
+    def __init__(self, **palette):
+        unknown = set(palette) - set(DEFAULT_PALETTE)
+        if unknown:
+            raise ValueError(f"Unknown palette entries: {sorted(unknown)}")
+
+        self._palette = dict(DEFAULT_PALETTE, **palette)
+        self._key = tuple(sorted(self._palette.items()))
+
+    def __getattr__(self, name: str) -> str:
+        try:
+            return self.__dict__["_palette"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Theme) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        changed = {
+            key: val
+            for key, val in self._palette.items()
+            if DEFAULT_PALETTE[key] != val
+        }
+        return f"Theme({', '.join(f'{k}={v!r}' for k, v in changed.items())})"
+
+    @property
+    def palette(self) -> dict:
+        """Copy of the palette."""
+        return dict(self._palette)
+
+    def replace(self, **palette) -> "Theme":
+        """Return a new theme with the given palette entries replaced."""
+        return Theme(**dict(self._palette, **palette))
+
+    @property
+    def stylesheets(self) -> MappingProxyType:
+        """Compiled stylesheets by their role, see `SS_TEMPLATES`."""
+        return _compile_stylesheets(self._key)
+
+    def stylesheet(self, role: str) -> str:
+        """Compiled stylesheet of the given role, see `SS_TEMPLATES`."""
+        return self.stylesheets[role]
+
+
+_THEME = Theme()
+
+
+def __getattr__(name: str):
+    """Create the `SS_*` stylesheets of the default theme and the
+    `COLOR_GRAPH_*` colors on first access, keeping the module import cheap.
+    """
+    if name.startswith("SS_") and name[3:].lower() in SS_TEMPLATES:
+        value = Theme().stylesheet(name[3:].lower())
+    elif name in _COLOR_GRAPH:
+        value = QtGui.QColor(*_COLOR_GRAPH[name])
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals())
+        | set(_COLOR_GRAPH)
+        | {"SS_" + role.upper() for role in SS_TEMPLATES}
+    )
+
+
+def current_theme() -> Theme:
+    """Return the theme that is currently in use by the `create_*` factories."""
+    return _THEME
+
+
+def apply_theme(theme: Theme) -> int:
+    """Switch all controls of this module over to `theme`, including controls
+    that have been created already.
+
+    Only the widgets whose stylesheet actually changes get restyled: Widgets
+    showing one of the stylesheets of the previous theme, including those set
+    by hand like `widget.setStyleSheet(SS_GROUP)`, painted LEDs and numeric
+    readouts, LED matrices and channel views. When the application-wide
+    stylesheet of `install_stylesheet()` is in use, it gets replaced as a
+    whole. Scene items of this module are repainted in every scene shown by a
+    `QGraphicsView`.
+
+    Returns:
+        The number of widgets and scene items that got restyled.
+    """
+    global _THEME  # pylint: disable=global-statement
+    old_theme, _THEME = _THEME, theme
+    if theme == old_theme:
+        return 0
+
+    app = QtWid.QApplication.instance()
+    if app is None:
+        return 0
+
+    if app.styleSheet() == app_stylesheet(old_theme):
+        app.setStyleSheet(app_stylesheet(theme))
+
+    old_sheets = old_theme.stylesheets
+    new_sheets = theme.stylesheets
+    replacements = {
+        old_sheets[role]: new_sheets[role]
+        for role in new_sheets
+        if old_sheets[role] != new_sheets[role]
+    }
+    old_colors = old_theme.palette
+    new_colors = theme.palette
+    changed_colors = {
+        key for key in new_colors if old_colors[key] != new_colors[key]
+    }
+
+    N_restyled = 0
+    scenes = set()
+    for widget in app.allWidgets():
+        if isinstance(widget, QtWid.QGraphicsView):
+            if widget.scene() is not None:
+                scenes.add(widget.scene())
+        if isinstance(widget, LED):
+            LED_args = _PAINTED_LEDS.get(widget.property(DVG_ROLE))
+            if LED_args and (
+                LED_args["color_off"] in changed_colors
+                or LED_args["color_on"] in changed_colors
+            ):
+                widget.setColors(
+                    new_colors[LED_args["color_off"]],
+                    new_colors[LED_args["color_on"]],
+                )
+                N_restyled += 1
+        elif isinstance(widget, NumericReadout):
+            if changed_colors & {
+                "COLOR_READ_ONLY",
+                "COLOR_HOVER_BORDER",
+                "COLOR_WARNING_YELLOW",
+            }:
+                widget.update()
+                N_restyled += 1
+        elif isinstance(widget, LEDMatrix):
+            if changed_colors & widget._palette_keys():
+                widget._rerender()
+                N_restyled += 1
+        elif isinstance(widget, ChannelView):
+            if changed_colors:
+                widget.viewport().update()
+                N_restyled += 1
+        elif replacements:
+            new_sheet = replacements.get(widget.styleSheet())
+            if new_sheet is not None:
+                widget.setStyleSheet(new_sheet)
+                N_restyled += 1
+
+    if changed_colors:
+        for scene in scenes:
+            for item in scene.items():
+                if isinstance(item, _ControlItem):
+                    # Also invalidates the item cache
+                    item.update()
+                    N_restyled += 1
+
+    return N_restyled
+
+
+# ------------------------------------------------------------------------------
+#   Application-wide stylesheet
+# ------------------------------------------------------------------------------
+
+# Name of the dynamic property that selects a stylesheet variant from the
+# application-wide stylesheet, see `install_stylesheet()`
+DVG_ROLE = "dvgRole"
+
+# When True, the `create_*` factories only set the `dvgRole` property instead of
+# a stylesheet of their own. Switched on by `install_stylesheet()`.
+_ROLE_ONLY = False
+
+# Cursor shared by all clickable controls, created on first use
+_POINTING_HAND_CURSOR = None
+
+
+def _pointing_hand_cursor() -> QtGui.QCursor:
+    global _POINTING_HAND_CURSOR  # pylint: disable=global-statement
+    if _POINTING_HAND_CURSOR is None:
+        _POINTING_HAND_CURSOR = QtGui.QCursor(
+            QtCore.Qt.CursorShape.PointingHandCursor
+        )
+    return _POINTING_HAND_CURSOR
+
+
+def _scope_stylesheet(ss: str, role: str) -> str:
+    """Rewrite stylesheet `ss` such that its rules only apply to widgets having
+    the dynamic property `dvgRole` set to `role`, or to their descendants. This
+    mimics the scope `ss` would have when set directly on such a widget.
+    """
+    role_selector = f'[{DVG_ROLE}="{role}"]'
+    rules = []
+    for selectors, body in re.findall(r"([^{}]+)\{([^{}]*)\}", ss):
+        scoped = []
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            # Insert the property selector right after the leading type
+            # selector of the widget itself, e.g.
+            # 'QPushButton:checked' -> 'QPushButton[dvgRole="x"]:checked'
+            end = re.match(r"[\w*]*", selector).end()
+            scoped.append(selector[:end] + role_selector + selector[end:])
+            scoped.append("*" + role_selector + " " + selector)
+        rules.append(", ".join(scoped) + " {" + body + "}")
+    return "\n".join(rules)
+
+
+def app_stylesheet(theme: Optional[Theme] = None) -> str:
+    """Return all stylesheets of this module combined into one, in which each
+    variant is selected by the dynamic property `dvgRole`. Defaults to the
+    current theme.
+    """
+    if theme is None:
+        theme = _THEME
+    return _compile_app_stylesheet(theme)
+
+
+@lru_cache(maxsize=None)
+def _compile_app_stylesheet(theme: Theme) -> str:
+    return "\n".join(
+        _scope_stylesheet(ss, role) for role, ss in theme.stylesheets.items()
+    )
+
+
+def install_stylesheet(app: QtWid.QApplication, role_only: bool = True):
+    """Install the combined stylesheet of `app_stylesheet()` application-wide,
+    replacing any existing application stylesheet. Qt then parses the CSS only
+    once, instead of once per control.
+
+    With `role_only=True` the `create_*` factories will from now on only set
+    the `dvgRole` property of the controls they create, instead of giving each
+    control its own copy of the stylesheet. Use `set_role()` to style other
+    widgets, like groupboxes and textboxes.
+    """
+    global _ROLE_ONLY  # pylint: disable=global-statement
+    app.setStyleSheet(app_stylesheet())
+    _ROLE_ONLY = role_only
+
+
+def set_role(widget: QtWid.QWidget, role: str):
+    """Select the stylesheet variant `role` (see `SS_TEMPLATES`) of the
+    application-wide stylesheet for `widget`.
+    """
+    if role not in SS_TEMPLATES:
+        raise ValueError(f"Unknown role '{role}'.")
+    widget.setProperty(DVG_ROLE, role)
+    if widget.testAttribute(QtCore.Qt.WidgetAttribute.WA_WState_Polished):
+        # Dynamic property changes are not picked up automatically
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+def _style_control(widget: QtWid.QWidget, role: str):
+    """Style a control created by one of the `create_*` factories."""
+    if _ROLE_ONLY:
+        set_role(widget, role)
+    else:
+        widget.setProperty(DVG_ROLE, role)
+        widget.setStyleSheet(_THEME.stylesheet(role))
+
+
+# ------------------------------------------------------------------------------
+#   Bulk updates
+# ------------------------------------------------------------------------------
+
+
+@contextmanager
+def frozen(container: QtWid.QWidget):
+    """Context manager that disables painting of `container` and its children,
+    and disables its layout, for the duration of the `with` block. On exit the
+    previous settings are restored, after which the layout is activated and
+    the container repaints once. Note that this repaints the whole container,
+    including the children that did not change, so keep the container as
+    small as possible.
+
+    Usage:
+        with frozen(panel):
+            for button in buttons:
+                button.setChecked(True)
+    """
+    updates_enabled = container.updatesEnabled()
+    layout = container.layout()
+    layout_enabled = layout.isEnabled() if layout is not None else False
+
+    container.setUpdatesEnabled(False)
+    if layout is not None:
+        layout.setEnabled(False)
+
+    try:
+        yield container
+    finally:
+        if layout is not None:
+            layout.setEnabled(layout_enabled)
+            if layout_enabled:
+                layout.activate()
+        container.setUpdatesEnabled(updates_enabled)
+
+
+def _bulk_changes(controls: Sequence, states: Sequence, texts) -> list:
+    """Return the (control, state, text) that differ from the current ones,
+    with `None` for the properties that need no change.
+    """
+    if texts is None:
+        texts = [None] * len(controls)
+    if not len(controls) == len(states) == len(texts):
+        raise ValueError(
+            "The number of controls, states and texts must be equal."
+        )
+
+    changes = []
+    for control, state, text in zip(controls, states, texts):
+        if state is not None:
+            state = bool(state)
+            if state == control.isChecked():
+                state = None
+        if text is not None and text == control.text():
+            text = None
+        if state is not None or text is not None:
+            changes.append((control, state, text))
+    return changes
+
+
+def bulk_update(
+    widgets: Sequence[QtWid.QWidget],
+    states: Sequence[Optional[bool]],
+    texts: Optional[Sequence[Optional[str]]] = None,
+    container: Optional[QtWid.QWidget] = None,
+) -> int:
+    """Set the checked state and, optionally, the text of a group of checkable
+    controls, like LEDs, relay buttons and toggle buttons, in one go.
+
+    Widgets whose state and text already match are skipped. When `container`
+    is given, the actual changes are performed inside a `frozen()` block on
+    it, so that the group is relayed out once. This repaints the whole
+    container, so only pass one that holds little else than the group. When
+    `container` is not given, the changes are applied directly and Qt merges
+    the repaints of the changed widgets into its next paint pass.
+
+    A state or text of `None` leaves that property of the widget untouched.
+
+    Returns:
+        The number of widgets that actually changed.
+    """
+    changes = _bulk_changes(widgets, states, texts)
+    if not changes:
+        return 0
+
+    if container is None:
+        _apply_changes(changes)
+    else:
+        with frozen(container):
+            _apply_changes(changes)
+
+    return len(changes)
+
+
+def _apply_changes(changes: list):
+    for control, state, text in changes:
+        if state is not None:
+            control.setChecked(state)
+        if text is not None:
+            control.setText(text)
+
+
+def bulk_update_items(
+    items: Sequence[_ControlItem],
+    states: Sequence[Optional[bool]],
+    texts: Optional[Sequence[Optional[str]]] = None,
+) -> int:
+    """Scene item counterpart of `bulk_update()`: Set the checked state and,
+    optionally, the text of a group of `LEDItem`s and `ButtonItem`s in one go.
+
+    Items whose state and text already match are skipped, so that their
+    cached pixmap stays valid. The scene repaints all changed items together
+    in its next update pass.
+
+    Returns:
+        The number of items that actually changed.
+    """
+    changes = _bulk_changes(items, states, texts)
+    _apply_changes(changes)
+    return len(changes)
+
+
+# ------------------------------------------------------------------------------
+#   Panel builder
+# ------------------------------------------------------------------------------
+
+# Control kinds of a panel spec, see `build_panel()`
+_PANEL_FACTORIES = {
+    "led_indicator": create_LED_indicator,
+    "led_indicator_rect": create_LED_indicator_rect,
+    "error_led": create_error_LED,
+    "tiny_led": create_tiny_LED,
+    "tiny_error_led": create_tiny_error_LED,
+    "relay_button": create_Relay_button,
+    "toggle_button": create_Toggle_button,
+    "toggle_button_2": create_Toggle_button_2,
+    "toggle_button_3": create_Toggle_button_3,
+}
+
+_PANEL_LAYOUTS = {
+    "grid": QtWid.QGridLayout,
+    "vbox": QtWid.QVBoxLayout,
+    "hbox": QtWid.QHBoxLayout,
+}
+
+# Keys of a control spec that are not passed on to its factory
+_PANEL_CONTROL_KEYS = ("control", "name", "label", "enabled")
+
+
+class Panel(QtWid.QWidget):
+    """Widget tree constructed by `build_panel()`.
+
+    Attributes:
+        controls (dict): The controls, groups and tab widgets of the spec that
+            have a "name", by name.
+        timings (dict): Construction time in seconds of each group and tab
+            page, including their nested groups, keyed by the path of titles,
+            e.g. "Pumps/Valves".
+        t_build (float): Total time in seconds of building the panel,
+            including the final layout pass and showing it.
+    """
+
+    def __init__(self, parent=None, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self.controls = {}
+        self.timings = {}
+        self.t_build = 0.0
+
+
+def build_panel(
+    spec: Union[dict, str],
+    parent: Optional[QtWid.QWidget] = None,
+    show: bool = True,
+) -> Panel:
+    """Construct a complete panel of groups, tabs and controls in one pass from
+    a declarative spec, instead of adding the widgets one at a time to live
+    layouts.
+
+    The whole widget tree is built with updates and all layouts disabled.
+    Every widget is created directly inside its final parent, and each group
+    and tab widget is styled while still empty, so that no stylesheet has to
+    cascade into already polished children. The layouts are activated once at
+    the end, after which the panel is shown.
+
+    The spec is a dict, or the path to a JSON file holding one, of the form::
+
+        {
+            "title": "Pump station",        # Optional window title
+            "layout": "vbox",               # "vbox" (default), "hbox", "grid"
+            "children": [
+                {
+                    "group": "Valves",
+                    "style": "group_rect",  # "group" (default), "group_rect"
+                    "columns": 2,           # Control pairs per grid row
+                    "children": [
+                        {
+                            "control": "relay_button",
+                            "name": "valve_1",
+                            "label": "Valve 1",
+                            "text": "0",
+                            "checked": False,
+                            "enabled": True,
+                        },
+                    ],
+                },
+                {
+                    "tabs": [
+                        {"title": "Pumps", "children": [...]},
+                    ],
+                },
+            ],
+        }
+
+    Groups default to a "grid" layout in which each control, together with
+    its optional label, takes up one row, or `columns` per row. Tab pages
+    default to a "vbox" layout. A control is one of the kinds "led_indicator",
+    "led_indicator_rect", "error_led", "tiny_led", "tiny_error_led",
+    "relay_button", "toggle_button", "toggle_button_2" and "toggle_button_3",
+    or the name of the corresponding `create_*` factory. Its remaining keys are
+    passed on to that factory, e.g. "painted" or "minimumWidth".
+
+    Args:
+        spec (dict | str): The panel spec, or the path to a JSON file.
+        parent (QWidget): Parent of the panel.
+        show (bool): Show the panel once it is built.
+
+    Returns:
+        The `Panel`, holding the named controls and the timings per group.
+    """
+    if not isinstance(spec, dict):
+        import json  # pylint: disable=import-outside-toplevel
+
+        with open(spec, encoding="utf-8") as f:
+            spec = json.load(f)
+
+    t_0 = time.perf_counter()
+    panel = Panel(parent)
+    if "title" in spec:
+        panel.setWindowTitle(spec["title"])
+
+    updates_enabled = panel.updatesEnabled()
+    panel.setUpdatesEnabled(False)
+    layouts = []
+    _build_children(panel, panel, spec, "", layouts, "vbox")
+
+    for layout in layouts:
+        layout.setEnabled(True)
+    panel.layout().activate()
+    panel.setUpdatesEnabled(updates_enabled)
+
+    if show:
+        panel.show()
+    panel.t_build = time.perf_counter() - t_0
+    return panel
+
+
+def _register(panel: Panel, item: dict, widget: QtWid.QWidget):
+    name = item.get("name")
+    if name is None:
+        return
+    if name in panel.controls:
+        raise ValueError(f"Duplicate name '{name}' in panel spec.")
+    panel.controls[name] = widget
+
+
+def _build_children(
+    panel: Panel,
+    widget: QtWid.QWidget,
+    spec: dict,
+    path: str,
+    layouts: list,
+    default_layout: str,
+):
+    """Fill `widget` with the children of `spec`, laid out by a new and
+    disabled layout, which is appended to `layouts`.
+    """
+    layout_kind = spec.get("layout", default_layout)
+    if layout_kind not in _PANEL_LAYOUTS:
+        raise ValueError(f"Unknown layout '{layout_kind}' in panel spec.")
+    layout = _PANEL_LAYOUTS[layout_kind](widget)
+    layout.setEnabled(False)
+    layouts.append(layout)
+
+    columns = spec.get("columns", 1)
+    row = 0
+    column = 0
+    for item in spec.get("children", ()):
+        label = None
+        if "group" in item:
+            child = _build_group(panel, widget, item, path, layouts)
+        elif "tabs" in item:
+            child = _build_tabs(panel, widget, item, path, layouts)
+        elif "control" in item:
+            child = _build_control(item, widget)
+            if item.get("label") is not None:
+                label = QtWid.QLabel(item["label"], widget)
+        else:
+            raise ValueError(f"Unknown item in panel spec: {item}")
+        _register(panel, item, child)
+
+        if layout_kind != "grid":
+            if label is not None:
+                layout.addWidget(label)
+            layout.addWidget(child)
+        elif "control" in item:
+            if label is not None:
+                layout.addWidget(label, row, 2 * column)
+            layout.addWidget(child, row, 2 * column + 1)
+            column += 1
+            if column == columns:
+                row += 1
+                column = 0
+        else:
+            # Groups and tabs span the full width of the grid
+            if column:
+                row += 1
+                column = 0
+            layout.addWidget(child, row, 0, 1, 2 * columns)
+            row += 1
+
+    if layout_kind == "grid":
+        layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+
+
+def _build_group(
+    panel: Panel,
+    parent: QtWid.QWidget,
+    item: dict,
+    path: str,
+    layouts: list,
+) -> QtWid.QGroupBox:
+    t_0 = time.perf_counter()
+    title = item["group"]
+    path = f"{path}/{title}" if path else title
+
+    role = item.get("style", "group")
+    if role not in ("group", "group_rect"):
+        raise ValueError(f"Unknown group style '{role}' in panel spec.")
+    group = QtWid.QGroupBox(title, parent)
+    _style_control(group, role)
+    _build_children(panel, group, item, path, layouts, "grid")
+
+    panel.timings[path] = time.perf_counter() - t_0
+    return group
+
+
+def _build_tabs(
+    panel: Panel,
+    parent: QtWid.QWidget,
+    item: dict,
+    path: str,
+    layouts: list,
+) -> QtWid.QTabWidget:
+    tabs = QtWid.QTabWidget(parent)
+    _style_control(tabs, "tabs")
+    for page_spec in item["tabs"]:
+        t_0 = time.perf_counter()
+        title = page_spec["title"]
+        page_path = f"{path}/{title}" if path else title
+
+        page = QtWid.QWidget(tabs)
+        _build_children(panel, page, page_spec, page_path, layouts, "vbox")
+        tabs.addTab(page, title)
+        _register(panel, page_spec, page)
+
+        panel.timings[page_path] = time.perf_counter() - t_0
+    return tabs
+
+
+def _build_control(item: dict, parent: QtWid.QWidget) -> QtWid.QWidget:
+    kind = item["control"]
+    factory = _PANEL_FACTORIES.get(kind)
+    if factory is None:
+        # Also accept the name of the factory itself
+        factory = next(
+            (f for f in _PANEL_FACTORIES.values() if f.__name__ == kind), None
+        )
+    if factory is None:
+        raise ValueError(f"Unknown control '{kind}' in panel spec.")
+
+    kwargs = {
+        key: value
+        for key, value in item.items()
+        if key not in _PANEL_CONTROL_KEYS
+    }
+    control = factory(parent=parent, **kwargs)
+    if not item.get("enabled", True):
+        control.setEnabled(False)
+    return control
+
+
+# ------------------------------------------------------------------------------
+#   Control pool
+# ------------------------------------------------------------------------------
+
+# Signals of which all connections are removed when a control is released
+_POOL_SIGNALS = ("clicked", "toggled", "pressed", "released")
+
+
+class ControlPool:
+    """Pool of pre-styled controls for panels whose controls come and go at
+    runtime, avoiding the repeated construction, stylesheet parsing and
+    destruction of widgets.
+
+    Controls are pooled per factory, like `create_LED_indicator_rect` or
+    `create_Toggle_button`, and per `painted` variant. A released control is
+    hidden, moved out of its panel and reset: It gets unchecked, stops
+    blinking, loses its text and returns to the enabled state of a fresh
+    control, all connections to its `clicked`, `toggled`, `pressed` and
+    `released` signals are removed and its `CommandThrottle`s are detached.
+    Other properties that were changed after acquiring the control are not
+    reset.
+
+    Usage:
+        pool = ControlPool()
+        pool.prewarm(create_Toggle_button, 64)
+
+        button = pool.acquire(create_Toggle_button, text="Off")
+        grid.addWidget(button, 0, 0)
+        ...
+        pool.release(button)
+    """
+
+    def __init__(self):
+        # Hidden parent keeping the free controls alive
+        self._shelf = QtWid.QWidget()
+        self._free = {}  # (factory, painted) -> [control, ...]
+        self._keys = {}  # control -> (factory, painted), for controls in use
+        self._enabled = {}  # (factory, painted) -> enabled state when fresh
+
+        self._N_hits = 0
+        self._N_misses = 0
+
+    def _create(self, key: tuple) -> QtWid.QWidget:
+        factory, painted = key
+        control = (
+            factory(painted=True, parent=self._shelf)
+            if painted
+            else factory(parent=self._shelf)
+        )
+        self._enabled.setdefault(key, control.isEnabled())
+        return control
+
+    def prewarm(
+        self, factory: Callable, N: int, painted: bool = False
+    ) -> "ControlPool":
+        """Create `N` controls of `factory` in advance, ready to be acquired.
+        Pre-warmed controls do not count towards the hits and misses.
+        """
+        key = (factory, painted)
+        free = self._free.setdefault(key, [])
+        free.extend(self._create(key) for _ in range(N))
+        return self
+
+    def acquire(
+        self,
+        factory: Callable,
+        text: str = "",
+        checked: bool = False,
+        painted: bool = False,
+        parent: Optional[QtWid.QWidget] = None,
+    ) -> QtWid.QWidget:
+        """Return a control of `factory` from the pool, or a newly created one
+        when the pool has none left. Just like a freshly created control, it
+        becomes visible once it is added to a layout.
+        """
+        key = (factory, painted)
+        free = self._free.get(key)
+        if free:
+            control = free.pop()
+            self._N_hits += 1
+        else:
+            control = self._create(key)
+            self._N_misses += 1
+        self._keys[control] = key
+
+        if text:
+            control.setText(text)
+        if checked:
+            control.setChecked(True)
+        if parent is not None:
+            control.setParent(parent)
+        return control
+
+    def release(self, control: QtWid.QWidget):
+        """Return `control` to the pool, resetting it for later reuse. It is
+        removed from its parent and layout.
+        """
+        key = self._keys.pop(control, None)
+        if key is None:
+            raise ValueError("Control was not acquired from this pool.")
+
+        # Reparenting hides the control
+        control.setParent(self._shelf)
+        for throttle in control.findChildren(CommandThrottle):
+            throttle.detach()
+        for name in _POOL_SIGNALS:
+            signal = getattr(control, name, None)
+            if signal is None:
+                continue
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                # No connections
+                pass
+
+        signals_blocked = control.blockSignals(True)
+        control.setChecked(False)
+        control.setText("")
+        control.setEnabled(self._enabled[key])
+        if isinstance(control, QtWid.QAbstractButton):
+            control.setDown(False)
+        elif isinstance(control, LED):
+            control.setBlinking(False)
+        control.blockSignals(signals_blocked)
+
+        self._free.setdefault(key, []).append(control)
+
+    def clear(self):
+        """Destroy all free controls in the pool."""
+        for free in self._free.values():
+            for control in free:
+                control.deleteLater()
+        self._free.clear()
+
+    def counters(self) -> dict:
+        """Return a snapshot of the counters `hits` and `misses` of
+        `acquire()`, the `hit_rate` and the number of controls that are `free`
+        and `in_use`.
+        """
+        N_acquired = self._N_hits + self._N_misses
+        return {
+            "hits": self._N_hits,
+            "misses": self._N_misses,
+            "hit_rate": self._N_hits / N_acquired if N_acquired else None,
+            "free": sum(len(free) for free in self._free.values()),
+            "in_use": len(self._keys),
+        }
+
+    def reset_counters(self):
+        self._N_hits = 0
+        self._N_misses = 0
+
+
+# ------------------------------------------------------------------------------
+#   Thread-safe updates
+# ------------------------------------------------------------------------------
+
+
+def _apply_state(widget: QtWid.QWidget, state):
+    """Default way of applying a posted state to a control: Strings set the
+    text, anything else sets the checked state, or the value of a
+    `NumericReadout`.
+    """
+    if isinstance(state, str):
+        if widget.text() != state:
+            widget.setText(state)
+    elif isinstance(widget, NumericReadout):
+        widget.set_value(state)
+    else:
+        state = bool(state)
+        if widget.isChecked() != state:
+            widget.setChecked(state)
+
+
+class UpdateBridge(QtCore.QObject):
+    """Bridge that lets any thread post new states for controls, like LEDs and
+    relay buttons, which get applied in the GUI thread at a fixed frame rate.
+
+    Posting never waits on the GUI thread. Only the latest state per control is
+    kept: Posting again before the next frame overwrites the pending state,
+    which is counted as `coalesced`. Posts that would exceed `max_pending`
+    distinct controls, or that are for unknown or deleted controls, are counted
+    as `dropped`.
+
+    Must be created in the GUI thread.
+
+    Usage:
+        bridge = UpdateBridge(fps=30)
+        bridge.register("pump_on", create_LED_indicator())
+        ...
+        # From any thread
+        bridge.post("pump_on", True)
+
+    Args:
+        fps (float): Rate at which pending states get applied.
+        max_pending (int): Maximum number of distinct controls with a pending
+            state. Default: No limit.
+    """
+
+    def __init__(
+        self,
+        fps: float = 30,
+        max_pending: Optional[int] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._widgets = {}
+        self._max_pending = max_pending
+        self._N_posted = 0
+        self._N_coalesced = 0
+        self._N_dropped = 0
+        self._N_applied = 0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.apply_pending)
+        self.set_fps(fps)
+        self._timer.start()
+
+    def set_fps(self, fps: float):
+        """Set the rate at which pending states get applied."""
+        self._timer.setInterval(max(1, round(1000 / fps)))
+
+    def register(self, widget_id, widget: QtWid.QWidget, apply=None):
+        """Register `widget` under the hashable `widget_id`. Optionally, pass a
+        function `apply(widget, state)` to apply posted states with, instead of
+        the default of setting the text for strings and the checked state, or
+        the value of a `NumericReadout`, for anything else.
+        """
+        self._widgets[widget_id] = (widget, apply or _apply_state)
+
+    def unregister(self, widget_id):
+        self._widgets.pop(widget_id, None)
+
+    def post(self, widget_id, state) -> bool:
+        """Post a new state for the control registered as `widget_id`. Can be
+        called from any thread.
+
+        Returns:
+            False when the post got dropped because of `max_pending`.
+        """
+        with self._lock:
+            self._N_posted += 1
+            if widget_id in self._pending:
+                self._N_coalesced += 1
+            elif (
+                self._max_pending is not None
+                and len(self._pending) >= self._max_pending
+            ):
+                self._N_dropped += 1
+                return False
+            self._pending[widget_id] = state
+        return True
+
+    def post_many(self, states: dict) -> int:
+        """Post the states of a dict `{widget_id: state}` at once. Can be called
+        from any thread.
+
+        Returns:
+            The number of posts that were not dropped.
+        """
+        N_accepted = 0
+        with self._lock:
+            for widget_id, state in states.items():
+                self._N_posted += 1
+                if widget_id in self._pending:
+                    self._N_coalesced += 1
+                elif (
+                    self._max_pending is not None
+                    and len(self._pending) >= self._max_pending
+                ):
+                    self._N_dropped += 1
+                    continue
+                self._pending[widget_id] = state
+                N_accepted += 1
+        return N_accepted
+
+    @QtCore.Slot()
+    def apply_pending(self) -> int:
+        """Apply all pending states. Called periodically by the internal timer
+        in the GUI thread, but can be called by hand from the GUI thread as
+        well.
+
+        Returns:
+            The number of states applied.
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+
+        N_applied = 0
+        N_dropped = 0
+        for widget_id, state in pending.items():
+            entry = self._widgets.get(widget_id)
+            if entry is None:
+                N_dropped += 1
+                continue
+            widget, apply = entry
+            try:
+                apply(widget, state)
+            except RuntimeError:
+                # Underlying C++ object got deleted
+                self.unregister(widget_id)
+                N_dropped += 1
+                continue
+            N_applied += 1
+
+        with self._lock:
+            self._N_applied += N_applied
+            self._N_dropped += N_dropped
+        return N_applied
+
+    def counters(self) -> dict:
+        """Return a snapshot of the counters `posted`, `coalesced`, `dropped`,
+        `applied` and the number of states still `pending`.
+        """
+        with self._lock:
+            return {
+                "posted": self._N_posted,
+                "coalesced": self._N_coalesced,
+                "dropped": self._N_dropped,
+                "applied": self._N_applied,
+                "pending": len(self._pending),
+            }
+
+    def reset_counters(self):
+        with self._lock:
+            self._N_posted = 0
+            self._N_coalesced = 0
+            self._N_dropped = 0
+            self._N_applied = 0
+
+
+# ------------------------------------------------------------------------------
+#   Data binding
+# ------------------------------------------------------------------------------
+
+
+class StateStore:
+    """Observable store of named values, like the state of a device, that
+    keeps track of which keys changed. Setting a key to a value equal to its
+    current one does not mark it dirty. Can be written to from any thread.
+
+    Usage:
+        store = StateStore()
+        store["pump_on"] = True
+        store.update({"T_1": 21.3, "T_2": 19.8})
+
+    Args:
+        values (dict): Initial values, which all start out dirty.
+    """
+
+    def __init__(self, values: Optional[dict] = None):
+        self._lock = threading.Lock()
+        self._values = dict(values or {})
+        self._dirty = set(self._values)
+
+    def __contains__(self, key) -> bool:
+        return key in self._values
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def set(self, key, value) -> bool:
+        """Set `key` to `value`.
+
+        Returns:
+            True when the value changed, marking the key dirty.
+        """
+        with self._lock:
+            if key in self._values and self._values[key] == value:
+                return False
+            self._values[key] = value
+            self._dirty.add(key)
+            return True
+
+    def update(self, values: dict) -> int:
+        """Set the values of a dict `{key: value}` at once.
+
+        Returns:
+            The number of values that changed.
+        """
+        N_changed = 0
+        with self._lock:
+            for key, value in values.items():
+                if key in self._values and self._values[key] == value:
+                    continue
+                self._values[key] = value
+                self._dirty.add(key)
+                N_changed += 1
+        return N_changed
+
+    def snapshot(self) -> dict:
+        """Return a copy of all values."""
+        with self._lock:
+            return dict(self._values)
+
+    def dirty_keys(self) -> set:
+        with self._lock:
+            return set(self._dirty)
+
+    def take_dirty(self) -> dict:
+        """Return the current values of all dirty keys and mark them clean."""
+        with self._lock:
+            dirty = {key: self._values[key] for key in self._dirty}
+            self._dirty.clear()
+        return dirty
+
+
+class _Binding:
+    __slots__ = ("keys", "many", "control", "converter", "apply")
+
+    def __init__(self, keys: tuple, many: bool, control, converter, apply):
+        self.keys = keys
+        self.many = many
+        self.control = control
+        self.converter = converter
+        self.apply = apply
+
+
+class Binder(QtCore.QObject):
+    """Links keys of a `StateStore` to controls, like the LEDs, buttons and
+    textboxes of the `create_*` factories and `NumericReadout`s.
+
+    Each tick only the keys that changed since the previous tick are applied,
+    to all controls bound to them. Hence, the cost of a tick grows with the
+    number of changes, not with the number of bindings. A key can be bound to
+    any number of controls, and `bind_many()` binds several keys to a single
+    control.
+
+    A converter turns the value of a key into the state of the control,
+    which gets applied like the posted states of `UpdateBridge`: Strings set
+    the text and anything else sets the checked state, or the value of a
+    `NumericReadout`. Converters can be any function, like `bool`, or a
+    `str.format()` template, like "{:.2f}".
+
+    Must be created in the GUI thread.
+
+    Usage:
+        binder = Binder(store)
+        binder.bind("pump_on", pump_LED)
+        binder.bind("pump_on", pump_button, lambda on: "On" if on else "Off")
+        binder.bind("T_1", T_1_textbox, "{:.2f}")
+        binder.bind_many(("T_1", "T_2"), alarm_LED, lambda T_1, T_2: T_1 > T_2)
+
+    Args:
+        store (StateStore): The store to follow.
+        fps (float): Rate of the ticks. Pass `None` to call `tick()` yourself.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        fps: Optional[float] = 30,
+        parent=None,
+    ):
+        super().__init__(parent)
+
+        self.store = store
+        self._bindings = {}  # key -> [_Binding, ...]
+
+        self._timer = None
+        if fps is not None:
+            self._timer = QtCore.QTimer(self)
+            self._timer.timeout.connect(self.tick)
+            self._timer.start(max(1, round(1000 / fps)))
+
+    def bind(
+        self,
+        key,
+        control,
+        converter: Union[Callable, str, None] = None,
+        apply: Optional[Callable] = None,
+    ) -> "Binder":
+        """Bind `key` of the store to `control`. The control is brought up to
+        date right away when the key exists.
+
+        Args:
+            converter (callable | str): Function `converter(value)` returning
+                the state of the control, or a `str.format()` template.
+            apply (callable): Function `apply(control, state)` to apply the
+                states with, instead of the default way.
+        """
+        return self._bind((key,), control, converter, apply)
+
+    def bind_many(
+        self,
+        keys: Sequence,
+        control,
+        converter: Callable,
+        apply: Optional[Callable] = None,
+    ) -> "Binder":
+        """Bind multiple `keys` of the store to a single `control`. Whenever
+        any of the keys changed, `converter(*values)` gets called with the
+        values of all `keys` in order.
+        """
+        return self._bind(tuple(keys), control, converter, apply, many=True)
+
+    def _bind(self, keys, control, converter, apply, many=False) -> "Binder":
+        if isinstance(converter, str):
+            converter = converter.format
+        binding = _Binding(
+            keys, many, control, converter, apply or _apply_state
+        )
+        for key in keys:
+            self._bindings.setdefault(key, []).append(binding)
+        if all(key in self.store for key in keys):
+            self._apply(binding, {})
+        return self
+
+    def unbind(self, control):
+        """Remove all bindings of `control`."""
+        for key in list(self._bindings):
+            bindings = [
+                binding
+                for binding in self._bindings[key]
+                if binding.control is not control
+            ]
+            if bindings:
+                self._bindings[key] = bindings
+            else:
+                del self._bindings[key]
+
+    def _apply(self, binding: _Binding, dirty: dict):
+        values = [
+            dirty[key] if key in dirty else self.store.get(key)
+            for key in binding.keys
+        ]
+        if binding.many:
+            state = binding.converter(*values)
+        else:
+            state = values[0]
+            if binding.converter is not None:
+                state = binding.converter(state)
+        binding.apply(binding.control, state)
+
+    @QtCore.Slot()
+    def tick(self) -> int:
+        """Apply the keys that changed since the previous tick. Called
+        periodically by the internal timer, unless `fps=None`.
+
+        Returns:
+            The number of bindings applied.
+        """
+        dirty = self.store.take_dirty()
+        if not dirty:
+            return 0
+
+        # A binding of several keys gets applied only once
+        pending = {}
+        for key in dirty:
+            for binding in self._bindings.get(key, ()):
+                pending[id(binding)] = binding
+
+        N_applied = 0
+        for binding in pending.values():
+            try:
+                self._apply(binding, dirty)
+            except RuntimeError:
+                # Underlying C++ object got deleted
+                self.unbind(binding.control)
+                continue
+            N_applied += 1
+        return N_applied
+
+
+class SharedStateBinder(Binder):
+    """`Binder` following the slots of a `dvg_state_plane.StatePlane`, which
+    is an array of values in shared memory written by another process, like
+    an acquisition process that runs without Qt. The keys to bind are the
+    slot indices.
+
+    Each tick only the blocks of the plane whose sequence counter changed get
+    copied, and are diffed against their previous values in a vectorized
+    way. Only the changed slots that are bound get applied. A block that the
+    writer was writing to at the time is retried on the next tick. Requires
+    Python >= 3.8 and NumPy.
+
+    Must be created in the GUI thread.
+
+    Usage:
+        # Acquisition process, without Qt
+        from dvg_state_plane import StatePlane
+        plane = StatePlane.create(N_slots=1000, name="dvg_plant")
+        plane.write(PUMP_ON, True)
+
+        # GUI process
+        binder = SharedStateBinder("dvg_plant")
+        binder.bind(PUMP_ON, pump_LED)
+        binder.bind(T_1, T_1_readout)
+
+    Args:
+        plane (str | StatePlane): The plane, or the name of the shared memory
+            of the plane to attach to.
+        fps (float): Rate of the ticks. Pass `None` to call `tick()` yourself.
+    """
+
+    def __init__(
+        self,
+        plane,
+        fps: Optional[float] = 30,
+        parent=None,
+    ):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        from dvg_state_plane import StatePlane
+
+        self._owns_plane = isinstance(plane, str)
+        if self._owns_plane:
+            plane = StatePlane.attach(plane)
+        self.plane = plane
+        self._reader_state = plane.new_reader_state()
+        self._bound = np.zeros(plane.N_slots, dtype=bool)
+
+        super().__init__(StateStore(), fps, parent)
+
+    def _bind(self, keys, control, converter, apply, many=False) -> "Binder":
+        for slot in keys:
+            if not 0 <= slot < self.plane.N_slots:
+                raise IndexError(
+                    f"Slot {slot} is outside of the state plane of "
+                    f"{self.plane.N_slots} slots."
+                )
+            self._bound[slot] = True
+            if slot not in self.store:
+                self.store.set(slot, float(self.plane.values[slot]))
+        return super()._bind(keys, control, converter, apply, many)
+
+    def unbind(self, control):
+        super().unbind(control)
+        self._bound[:] = False
+        self._bound[list(self._bindings)] = True
+
+    @QtCore.Slot()
+    def tick(self) -> int:
+        """Read the slots that changed since the previous tick and apply the
+        bound ones. Called periodically by the internal timer, unless
+        `fps=None`.
+
+        Returns:
+            The number of bindings applied.
+        """
+        slots, values = self.plane.read_changes(*self._reader_state)
+        bound = self._bound[slots]
+        if bound.any():
+            self.store.update(
+                dict(zip(slots[bound].tolist(), values[bound].tolist()))
+            )
+        return super().tick()
+
+    def close(self):
+        """Stop ticking, and detach from the plane when it was attached to by
+        name.
+        """
+        if self._timer is not None:
+            self._timer.stop()
+        if self._owns_plane:
+            self.plane.close()
+
+
+# ------------------------------------------------------------------------------
+#   Instrumentation
+# ------------------------------------------------------------------------------
+
+
+class _RenderInstrumentation(QtCore.QObject):
+    """Application-wide event filter that counts and times the paint, polish,
+    style-change and layout-request events per control type. Use through
+    `enable_instrumentation()`.
+
+    To time an event, the filter delivers it itself from within the filter
+    using `sendEvent()`, so that the other event filters of the widget still
+    get to see it, and then stops the original delivery. Application-wide
+    event filters run newest first, so those installed after this one see the
+    timed events twice: Once for the original and once for the delivery by
+    this filter.
+    """
+
+    EVENT_NAMES = {
+        QtCore.QEvent.Type.Paint: "Paint",
+        QtCore.QEvent.Type.Polish: "Polish",
+        QtCore.QEvent.Type.StyleChange: "StyleChange",
+        QtCore.QEvent.Type.LayoutRequest: "LayoutRequest",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._stats = {}  # {(control_type, event_name): [count, seconds]}
+        self._delivering = set()  # Ids of events being delivered by us
+
+    def eventFilter(self, obj, event) -> bool:
+        event_name = self.EVENT_NAMES.get(event.type())
+        if (
+            event_name is None
+            or id(event) in self._delivering
+            or not isinstance(obj, QtWid.QWidget)
+        ):
+            return False
+
+        control_type = obj.property(DVG_ROLE) or type(obj).__name__
+        self._delivering.add(id(event))
+        try:
+            t_0 = time.perf_counter()
+            QtCore.QCoreApplication.sendEvent(obj, event)
+            duration = time.perf_counter() - t_0
+        finally:
+            self._delivering.discard(id(event))
+
+        with self._lock:
+            entry = self._stats.setdefault((control_type, event_name), [0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = {}
+            for (control_type, event_name), (count, t) in self._stats.items():
+                snapshot.setdefault(control_type, {})[event_name] = {
+                    "count": count,
+                    "time_ms": t * 1e3,
+                }
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+_INSTRUMENTATION = None
+
+
+def enable_instrumentation():
+    """Start counting and timing the Paint, Polish, StyleChange and
+    LayoutRequest events of all widgets, grouped per control type. The control
+    type is the `dvgRole` of the widget, see `set_role()`, or else its class
+    name. Retrieve the results with `stats()`.
+
+    Intended for finding rendering hot spots. The instrumentation itself adds
+    overhead to every event of the application, so disable it when done.
+
+    Note: Application-wide event filters installed after enabling the
+    instrumentation see each Paint, Polish, StyleChange and LayoutRequest
+    event twice. Install those filters first when that matters.
+    """
+    global _INSTRUMENTATION  # pylint: disable=global-statement
+    if _INSTRUMENTATION is None:
+        app = QtWid.QApplication.instance()
+        if app is None:
+            raise RuntimeError("A QApplication must be created first.")
+        _INSTRUMENTATION = _RenderInstrumentation(app)
+        app.installEventFilter(_INSTRUMENTATION)
+
+
+def disable_instrumentation():
+    """Stop the instrumentation of `enable_instrumentation()`. The collected
+    statistics are discarded.
+    """
+    global _INSTRUMENTATION  # pylint: disable=global-statement
+    if _INSTRUMENTATION is not None:
+        app = QtWid.QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(_INSTRUMENTATION)
+        _INSTRUMENTATION.deleteLater()
+        _INSTRUMENTATION = None
+
+
+def stats() -> dict:
+    """Return a snapshot of the instrumentation statistics as
+    `{control_type: {event_name: {"count": int, "time_ms": float}}}`.
+    Returns an empty dict when the instrumentation is disabled.
+    """
+    if _INSTRUMENTATION is None:
+        return {}
+    return _INSTRUMENTATION.stats()
+
+
+def reset_stats():
+    """Reset the instrumentation statistics to zero."""
+    if _INSTRUMENTATION is not None:
+        _INSTRUMENTATION.reset()
+
+
+# ------------------------------------------------------------------------------
+#   Event-loop lag monitor
+# ------------------------------------------------------------------------------
+
+# Log-spaced buckets of the lag histogram of `LagMonitor`: The lower edge of the
+# first bucket [s], the number of buckets per decade and the number of buckets.
+# Lags outside of the range are counted in the first or last bucket.
+_LAG_HIST_MIN = 1e-4
+_LAG_HIST_PER_DECADE = 10
+_LAG_HIST_N_BUCKETS = 60
+
+
+class LagMonitor(LED):
+    """Status indicator of the responsiveness of the GUI event loop, looking
+    like a rectangular LED.
+
+    A background thread posts a timestamped probe to the GUI thread every
+    `interval`, and waits for it to be handled before posting the next one.
+    The lag of each probe, i.e. how late it got handled, is kept for the most
+    recent `window` probes. The LED shows the maximum lag in this window,
+    colored `COLOR_LED_GREEN` below `warn`, `COLOR_WARNING_YELLOW` below
+    `stall` and `COLOR_ERROR_RED` otherwise.
+
+    All lags since the start, or since `reset_stats()`, are counted in a
+    histogram with 10 log-spaced buckets per decade, from 0.1 ms up to 100 s.
+    The p50 and p99 lag are estimated from this histogram as the upper edge
+    of the bucket they fall in, i.e. within 26 %. The tooltip of the LED shows
+    these together with the maximum lag.
+
+    When a probe is late by more than `stall`, the stack of the GUI thread is
+    captured while it is still stalled. Once the GUI thread recovers, the
+    optional callback `on_stall(lag, stack)` is called from the GUI thread,
+    with the lag in seconds and the captured stack as a string.
+
+    When idle, the monitor costs a single thread wake-up and queued signal per
+    interval.
+
+    Args:
+        interval (float): Time between probes [s].
+        warn (float): Lag [s] above which the LED turns yellow.
+        stall (float): Lag [s] above which the LED turns red and which counts
+            as a stall.
+        window (int): Number of most recent probes to show the lag of.
+        on_stall (callable): Function `on_stall(lag: float, stack: str)`.
+    """
+
+    _probe = QtCore.Signal(float)
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        warn: float = 0.05,
+        stall: float = 0.2,
+        window: int = 40,
+        on_stall: Optional[Callable] = None,
+        parent=None,
+        **kwargs,
+    ):
+        super().__init__(
+            checked=True,
+            shape="rect",
+            color_off=_THEME.COLOR_LED_GREEN,
+            color_on=_THEME.COLOR_LED_GREEN,
+            parent=parent,
+            **kwargs,
+        )
+        self.setFixedWidth(e8(6, self.font()))
+
+        self._interval = interval
+        self._warn = warn
+        self._stall = stall
+        self._on_stall = on_stall
+        self._lags = deque(maxlen=window)
+        self._hist = [0] * _LAG_HIST_N_BUCKETS
+        self._lag_max = 0.0
+        self._N_probes = 0
+        self._N_stalls = 0
+        self._stall_stack = (None, "")  # (timestamp of the probe, stack)
+
+        self._gui_thread = threading.get_ident()
+        self._handled = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._probe.connect(self._on_probe)
+        self.start()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="dvg_lag_monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self._handled.clear()
+            t_probe = time.perf_counter()
+            try:
+                self._probe.emit(t_probe)
+            except RuntimeError:
+                # Underlying C++ object got deleted
+                return
+            if self._handled.wait(self._stall):
+                continue
+
+            self._stall_stack = (t_probe, self._gui_stack())
+            while not self._handled.wait(self._interval):
+                if self._stopped.is_set():
+                    return
+
+    def _gui_stack(self) -> str:
+        """Return the current stack of the GUI thread."""
+        import traceback  # pylint: disable=import-outside-toplevel
+
+        # pylint: disable=protected-access
+        frame = sys._current_frames().get(self._gui_thread)
+        return "".join(traceback.format_stack(frame)) if frame else ""
+
+    @QtCore.Slot(float)
+    def _on_probe(self, t_probe: float):
+        lag = time.perf_counter() - t_probe
+        self._handled.set()
+        self._lags.append(lag)
+        self._hist[_lag_bucket(lag)] += 1
+        self._lag_max = max(self._lag_max, lag)
+        self._N_probes += 1
+
+        if lag >= self._stall:
+            self._N_stalls += 1
+            if self._on_stall is not None:
+                t_stack, stack = self._stall_stack
+                self._on_stall(lag, stack if t_stack == t_probe else "")
+
+        lag_max = max(self._lags)
+        if lag_max < self._warn:
+            color = _THEME.COLOR_LED_GREEN
+        elif lag_max < self._stall:
+            color = _THEME.COLOR_WARNING_YELLOW
+        else:
+            color = _THEME.COLOR_ERROR_RED
+        self.setColors(color, color)
+        self.setText(f"{lag_max * 1e3:.0f} ms")
+        if self.underMouse():
+            self._update_tooltip()
+
+    def enterEvent(self, event):
+        self._update_tooltip()
+        super().enterEvent(event)
+
+    def _update_tooltip(self):
+        stats = self.stats()
+        self.setToolTip(
+            f"Event-loop lag of {stats['N_probes']} probes\n"
+            f"p50: {stats['p50'] * 1e3:.1f} ms\n"
+            f"p99: {stats['p99'] * 1e3:.1f} ms\n"
+            f"max: {stats['max'] * 1e3:.1f} ms\n"
+            f"stalls: {stats['N_stalls']}"
+        )
+
+    def stats(self) -> dict:
+        """Return the p50, p99 and maximum lag [s] of all probes, and the
+        number of probes and stalls. The percentiles are estimated from the
+        histogram.
+        """
+        return {
+            "p50": self._percentile(0.5),
+            "p99": self._percentile(0.99),
+            "max": self._lag_max,
+            "N_probes": self._N_probes,
+            "N_stalls": self._N_stalls,
+        }
+
+    def histogram(self) -> list:
+        """Return the lag histogram as a list of (upper edge of the bucket
+        [s], count), for all buckets.
+        """
+        return [
+            (_lag_bucket_edge(bucket + 1), count)
+            for bucket, count in enumerate(self._hist)
+        ]
+
+    def _percentile(self, fraction: float) -> float:
+        N_needed = fraction * self._N_probes
+        N_counted = 0
+        for bucket, count in enumerate(self._hist):
+            N_counted += count
+            if count and N_counted >= N_needed:
+                return min(_lag_bucket_edge(bucket + 1), self._lag_max)
+        return 0.0
+
+    def reset_stats(self):
+        self._lags.clear()
+        self._hist = [0] * _LAG_HIST_N_BUCKETS
+        self._lag_max = 0.0
+        self._N_probes = 0
+        self._N_stalls = 0
+
+
+def _lag_bucket(lag: float) -> int:
+    """Return the bucket of the lag histogram that `lag` [s] falls in."""
+    if lag <= _LAG_HIST_MIN:
+        return 0
+    bucket = int(math.log10(lag / _LAG_HIST_MIN) * _LAG_HIST_PER_DECADE)
+    return min(bucket, _LAG_HIST_N_BUCKETS - 1)
+
+
+def _lag_bucket_edge(bucket: int) -> float:
+    """Return the lower edge [s] of `bucket` of the lag histogram."""
+    return _LAG_HIST_MIN * 10 ** (bucket / _LAG_HIST_PER_DECADE)
+
+
+# ------------------------------------------------------------------------------
+#   Star-import
+# ------------------------------------------------------------------------------
+
+# Public API. Includes the lazily created constants, which a star-import
+# resolves through `__getattr__()`.
+__all__ = [
+    # Qt lib
+    "PYQT5",
+    "PYQT6",
+    "PYSIDE2",
+    "PYSIDE6",
+    "QT_LIB",
+    "QT_LIB_ORDER",
+    "QtCore",
+    "QtGui",
+    "QtWid",
+    # Colors, stylesheets and other constants
+    "BLINK_INTERVAL",
+    "COLOR_BG",
+    "COLOR_BISQUE_5",
+    "COLOR_BUTTON_BG",
+    "COLOR_ERROR_RED",
+    "COLOR_GRAPH_BG",
+    "COLOR_GRAPH_FG",
+    "COLOR_GROUP_BG",
+    "COLOR_HOVER",
+    "COLOR_HOVER_BORDER",
+    "COLOR_INDIAN_RED_2",
+    "COLOR_LED_GREEN",
+    "COLOR_LED_NEUTRAL",
+    "COLOR_LED_RED",
+    "COLOR_PENS",
+    "COLOR_PEN_BLUE",
+    "COLOR_PEN_GREEN",
+    "COLOR_PEN_ORANGE",
+    "COLOR_PEN_PINK",
+    "COLOR_PEN_RED",
+    "COLOR_PEN_TURQUOISE",
+    "COLOR_PEN_WHITE",
+    "COLOR_PEN_YELLOW",
+    "COLOR_READ_ONLY",
+    "COLOR_SPRING_GREEN_2",
+    "COLOR_TAB",
+    "COLOR_TAB_ACTIVE",
+    "COLOR_WARNING_YELLOW",
+    "DEFAULT_PALETTE",
+    "DFLT_TOGGLE_BTN_BORDER_RADIUS",
+    "DFLT_TOGGLE_BTN_BORDER_WIDTH",
+    "DFLT_TOGGLE_BTN_PADDING",
+    "DVG_ROLE",
+    "GROUP_MARGIN_TOP",
+    "LED_MATRIX_COLORS",
+    "SS_ERROR_LED",
+    "SS_GROUP",
+    "SS_GROUP_RECT",
+    "SS_HOVER",
+    "SS_LED_INDICATOR",
+    "SS_LED_INDICATOR_RECT",
+    "SS_RELAY_BUTTON",
+    "SS_RELAY_BUTTON_PENDING",
+    "SS_TABS",
+    "SS_TEMPLATES",
+    "SS_TEXTBOX_ERRORS",
+    "SS_TEXTBOX_READ_ONLY",
+    "SS_TINY_ERROR_LED",
+    "SS_TINY_LED",
+    "SS_TITLE",
+    "SS_TOGGLE_BUTTON",
+    "SS_TOGGLE_BUTTON_2",
+    "SS_TOGGLE_BUTTON_3",
+    # Factories and functions
+    "app_stylesheet",
+    "apply_theme",
+    "build_panel",
+    "bulk_update",
+    "bulk_update_items",
+    "create_LED_indicator",
+    "create_LED_indicator_rect",
+    "create_Relay_button",
+    "create_Toggle_button",
+    "create_Toggle_button_2",
+    "create_Toggle_button_3",
+    "create_error_LED",
+    "create_tiny_LED",
+    "create_tiny_error_LED",
+    "current_theme",
+    "disable_instrumentation",
+    "e8",
+    "e8_many",
+    "enable_instrumentation",
+    "frozen",
+    "install_stylesheet",
+    "reset_stats",
+    "set_e8_widths",
+    "set_role",
+    "stats",
+    # Classes
+    "Binder",
+    "ButtonItem",
+    "ChannelColumn",
+    "ChannelDelegate",
+    "ChannelTableModel",
+    "ChannelView",
+    "CommandThrottle",
+    "ControlPool",
+    "LED",
+    "LEDItem",
+    "LEDMatrix",
+    "LagMonitor",
+    "LogConsole",
+    "NumericReadout",
+    "Panel",
+    "RelayButton",
+    "SharedStateBinder",
+    "Sparkline",
+    "StateStore",
+    "StreamingChart",
+    "Theme",
+    "UpdateBridge",
+]
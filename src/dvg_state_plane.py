@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared-memory state plane: A NumPy array of control states living in shared
+memory, written by a separate acquisition process and read by the GUI process
+through `dvg_pyqt_controls.SharedStateBinder`.
+
+This module does not import Qt, so it can be used by a writer process that
+has no GUI. Requires Python >= 3.8 and NumPy.
+"""
+__author__ = "Dennis van Gils"
+__authoremail__ = "vangils.dennis@gmail.com"
+__url__ = "https://github.com/Dennis-van-Gils/python-dvg-pyqt-controls"
+
+import os
+import sys
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Header of the shared memory: magic number, N_slots, block_size, reserved
+_MAGIC = 0x44764753
+_HEADER_SIZE = 4 * 8
+
+# Names of the shared memory created by this process
+_CREATED_NAMES = set()
+
+
+def _open_shared_memory(name: str):
+    """Attach to existing shared memory without letting the resource tracker
+    of this process unlink it at exit, which is the job of its creator.
+    """
+    # pylint: disable=import-outside-toplevel
+    import multiprocessing
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # Before Python 3.13, attaching registers the memory with the resource
+    # tracker. Undo that, unless the tracker is the one of the creator: When
+    # the creator is this process or a process started by `multiprocessing`,
+    # which shares the tracker of its parent.
+    shm = shared_memory.SharedMemory(name=name)
+    # pylint: disable=protected-access
+    if (
+        os.name == "posix"
+        and shm._name not in _CREATED_NAMES
+        and multiprocessing.parent_process() is None
+    ):
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class StatePlane:
+    """Array of `N_slots` float64 values in shared memory, divided into blocks
+    of `block_size` slots that each have a sequence counter. Booleans are
+    stored as 0 and 1.
+
+    The writer increments the counter of a block before and after writing to
+    it, so the counter is odd while a write is in progress. A reader copies
+    only the blocks whose counter changed since its previous read, and
+    discards a copy when the counter changed during copying. It retries such
+    a block on its next read. There must be a single writer.
+
+    Create instances with `create()` in one process and `attach()` in the
+    others.
+
+    Usage:
+        # Writer process
+        plane = StatePlane.create(N_slots=1000, name="dvg_plant")
+        plane.write(12, True)
+        plane.write_range(100, temperatures)
+        ...
+        plane.close()
+        plane.unlink()
+
+        # GUI process
+        binder = SharedStateBinder("dvg_plant")
+        binder.bind(12, pump_LED)
+    """
+
+    def __init__(self, shm):
+        self._shm = shm
+        header = np.ndarray((4,), dtype=np.uint64, buffer=shm.buf)
+        if int(header[0]) != _MAGIC:
+            raise ValueError(f"Shared memory '{shm.name}' is no state plane.")
+
+        self.N_slots = int(header[1])
+        self.block_size = int(header[2])
+        self.N_blocks = -(-self.N_slots // self.block_size)
+        self.seq = np.ndarray(
+            (self.N_blocks,),
+            dtype=np.uint64,
+            buffer=shm.buf,
+            offset=_HEADER_SIZE,
+        )
+        self.values = np.ndarray(
+            (self.N_slots,),
+            dtype=np.float64,
+            buffer=shm.buf,
+            offset=_HEADER_SIZE + 8 * self.N_blocks,
+        )
+        del header
+
+    @classmethod
+    def create(
+        cls, N_slots: int, block_size: int = 64, name: Optional[str] = None
+    ) -> "StatePlane":
+        """Create a new state plane, with all values 0."""
+        # pylint: disable=import-outside-toplevel
+        from multiprocessing import shared_memory
+
+        N_blocks = -(-N_slots // block_size)
+        shm = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            size=_HEADER_SIZE + 8 * N_blocks + 8 * N_slots,
+        )
+        _CREATED_NAMES.add(shm._name)  # pylint: disable=protected-access
+        header = np.ndarray((4,), dtype=np.uint64, buffer=shm.buf)
+        header[:] = (_MAGIC, N_slots, block_size, 0)
+        del header
+
+        plane = cls(shm)
+        plane.seq[:] = 0
+        plane.values[:] = 0
+        return plane
+
+    @classmethod
+    def attach(cls, name: str) -> "StatePlane":
+        """Attach to the existing state plane `name`."""
+        return cls(_open_shared_memory(name))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(self, slot: int, value: float):
+        block = slot // self.block_size
+        self.seq[block] += 1
+        self.values[slot] = value
+        self.seq[block] += 1
+
+    def write_many(self, slots: Sequence[int], values):
+        """Write `values` to the, not necessarily contiguous, `slots`."""
+        slots = np.asarray(slots, dtype=np.intp)
+        blocks = np.unique(slots // self.block_size)
+        self.seq[blocks] += 1
+        self.values[slots] = values
+        self.seq[blocks] += 1
+
+    def write_range(self, start: int, values):
+        """Write `values` to the contiguous slots starting at `start`."""
+        values = np.asarray(values, dtype=np.float64)
+        end = start + len(values)
+        if not len(values):
+            return
+        blocks = slice(
+            start // self.block_size, (end - 1) // self.block_size + 1
+        )
+        self.seq[blocks] += 1
+        self.values[start:end] = values
+        self.seq[blocks] += 1
+
+    def new_reader_state(self) -> tuple:
+        """Return the (seq, values) to pass to the first `read_changes()`, such
+        that it reports all values.
+        """
+        return (
+            np.full(self.N_blocks, np.iinfo(np.uint64).max, dtype=np.uint64),
+            np.full(self.N_slots, np.nan),
+        )
+
+    def read_changes(self, last_seq, last_values) -> tuple:
+        """Return the slots whose value changed since the previous call, and
+        their new values. Only the blocks whose sequence counter changed are
+        looked at. `last_seq` and `last_values` hold the state of the reader,
+        see `new_reader_state()`, and get updated in place.
+
+        Returns:
+            (slots, values) as NumPy arrays.
+        """
+        seq = self.seq.copy()
+        blocks = np.flatnonzero((seq != last_seq) & (seq % 2 == 0))
+        if not len(blocks):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        slots = (
+            blocks[:, None] * self.block_size + np.arange(self.block_size)
+        ).ravel()
+        slots = slots[slots < self.N_slots]
+        values = self.values[slots]
+
+        # Discard the blocks that got written to while copying
+        intact = self.seq[blocks] == seq[blocks]
+        if not intact.all():
+            intact_slots = intact[
+                np.searchsorted(blocks, slots // self.block_size)
+            ]
+            slots = slots[intact_slots]
+            values = values[intact_slots]
+            blocks = blocks[intact]
+        last_seq[blocks] = seq[blocks]
+
+        old = last_values[slots]
+        changed = (values != old) & ~(np.isnan(values) & np.isnan(old))
+        slots = slots[changed]
+        values = values[changed]
+        last_values[slots] = values
+        return slots, values
+
+    def close(self):
+        """Detach from the shared memory. The plane can not be used anymore."""
+        del self.seq
+        del self.values
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory, to be called once by its creator."""
+        self._shm.unlink()
+        # pylint: disable=protected-access
+        _CREATED_NAMES.discard(self._shm._name)
@@ -0,0 +1,16 @@
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    import dvg_pyqt_controls as c  # pylint: disable=import-outside-toplevel
+
+    return c.QtWid.QApplication.instance() or c.QtWid.QApplication([])
@@ -0,0 +1,26 @@
+import dvg_pyqt_controls as c
+
+
+def test_release_detaches_throttles(qapp):
+    pool = c.ControlPool()
+    requested = []
+    for _ in range(10):
+        button = pool.acquire(c.create_Toggle_button, text="Off")
+        throttle = c.CommandThrottle(button, interval=50)
+        throttle.commandRequested.connect(requested.append)
+        pool.release(button)
+
+    # The same button got reused every time
+    assert pool.counters()["misses"] == 1
+    assert not button.findChildren(c.CommandThrottle)
+    assert not button.findChildren(c.QtCore.QTimer)
+
+    # A new throttle of the reused button is the only one to respond
+    button = pool.acquire(c.create_Toggle_button, text="Off")
+    throttle = c.CommandThrottle(button, interval=50)
+    throttle.commandRequested.connect(requested.append)
+    button.click()
+    assert requested == [True]
+    assert button.findChildren(c.CommandThrottle) == [throttle]
+    pool.release(button)
+    pool.clear()
@@ -0,0 +1,43 @@
+import sys
+import types
+import typing
+
+import dvg_pyqt_controls as c
+
+QT_ALIASES = {"QtCore", "QtGui", "QtWid"}
+
+
+def test_all_names_resolve():
+    for name in c.__all__:
+        assert hasattr(c, name), name
+    assert len(set(c.__all__)) == len(c.__all__)
+
+
+def test_all_has_no_stray_names():
+    for name in c.__all__:
+        value = getattr(c, name)
+        assert name not in dir(typing), name
+        if isinstance(value, types.ModuleType):
+            assert name in QT_ALIASES, name
+        elif callable(value):
+            # No stdlib functions or classes, only those of this module
+            assert value.__module__ == c.__name__, name
+    for name in ("lib", "qt_libs", "os", "sys", "re", "time", "threading"):
+        assert name not in c.__all__
+
+
+def test_all_lists_every_public_definition():
+    for name, value in vars(c).items():
+        if name.startswith("_"):
+            continue
+        if getattr(value, "__module__", None) == c.__name__:
+            assert name in c.__all__, name
+
+
+def test_star_import():
+    namespace = {"os": "untouched"}
+    exec("from dvg_pyqt_controls import *", namespace)
+    assert namespace["os"] == "untouched"
+    for name in ("SS_GROUP", "SS_LED_INDICATOR", "COLOR_GRAPH_BG", "QtWid"):
+        assert name in namespace, name
+    assert sys.modules["dvg_pyqt_controls"] is c
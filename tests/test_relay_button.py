@@ -0,0 +1,64 @@
+import time
+import threading
+
+import dvg_pyqt_controls as c
+
+
+def process_events(qapp, duration: float):
+    t_end = time.perf_counter() + duration
+    while time.perf_counter() < t_end:
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def test_no_concurrent_commands_after_timeout(qapp):
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+    sent = []
+
+    def command(state):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+            sent.append(state)
+        # Only the first command is slow enough to time out
+        time.sleep(0.3 if len(sent) == 1 else 0.01)
+        with lock:
+            running[0] -= 1
+        return True
+
+    button = c.RelayButton(command, timeout=0.1)
+    finished = []
+    button.commandFinished.connect(
+        lambda state, success: finished.append((state, success))
+    )
+
+    button.click()
+    process_events(qapp, 0.15)
+    assert finished == [(True, False)]  # Timed out and rolled back
+    assert not button.isChecked()
+    assert button.is_pending()  # The command is still running
+
+    button.click()
+    process_events(qapp, 1.0)
+    assert max_running[0] == 1
+    assert sent == [True, True]
+    assert button.isChecked()
+    assert not button.is_pending()
+
+
+def test_clicks_reverse_a_pending_switch(qapp):
+    sent = []
+
+    def command(state):
+        sent.append(state)
+        time.sleep(0.1)
+        return True
+
+    button = c.RelayButton(command)
+    for _ in range(4):
+        button.click()
+    process_events(qapp, 0.5)
+    assert sent == [True, False]
+    assert not button.isChecked()
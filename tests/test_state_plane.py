@@ -0,0 +1,70 @@
+import os
+import sys
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Creates a plane, lets a child process attach to it and write a value, and
+# unlinks the plane. The resource tracker reports its problems on stderr.
+SCRIPT = """
+import os
+import sys
+import subprocess
+import multiprocessing
+
+sys.path.insert(0, {src_dir!r})
+from dvg_state_plane import StatePlane
+
+
+def child(name):
+    plane = StatePlane.attach(name)
+    plane.write(1, 5.0)
+    plane.close()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+        sys.exit(0)
+
+    plane = StatePlane.create(8, name="dvg_test_%d" % os.getpid())
+    if {method!r} == "subprocess":
+        subprocess.run(
+            [sys.executable, __file__, "--child", plane.name], check=True
+        )
+    else:
+        process = multiprocessing.get_context({method!r}).Process(
+            target=child, args=(plane.name,)
+        )
+        process.start()
+        process.join()
+    print(plane.values[1])
+    plane.close()
+    plane.unlink()
+"""
+
+
+def run_script(tmp_path, method: str) -> subprocess.CompletedProcess:
+    script = tmp_path / f"attach_{method}.py"
+    script.write_text(SCRIPT.format(src_dir=SRC_DIR, method=method))
+    return subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+
+
+def test_attach_in_spawned_child(tmp_path):
+    result = run_script(tmp_path, "spawn")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "5.0"
+    assert result.stderr == ""
+
+
+def test_attach_in_unrelated_process(tmp_path):
+    result = run_script(tmp_path, "subprocess")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "5.0"
+    assert result.stderr == ""